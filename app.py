@@ -1,44 +1,69 @@
-import hashlib
-from urllib.parse import urlparse
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
+from blake3 import blake3
 from flask import Flask, render_template, request, jsonify, send_file, Response
 from werkzeug.utils import secure_filename
 
 from outloud import db, tts, worker
 from outloud.config import (
-    TEXTS_DIR,
-    AUDIO_DIR,
-    UPLOAD_DIR,
-    TIMESTAMPS_DIR,
+    get_texts_dir,
+    get_audio_dir,
+    get_upload_dir,
+    get_timestamps_dir,
     setup_logging,
     get_logger,
 )
 
 logger = get_logger("app")
 
+_HTTP_URL_RE = re.compile(r"https?://[^/?#\s]+", re.IGNORECASE)
+_ACCEL_REDIRECT_PREFIX = os.environ.get("OUTLOUD_ACCEL_REDIRECT", "").rstrip("/")
 
-def compute_file_hash(file_storage) -> str:
-    """Compute SHA256 hash of uploaded file."""
-    sha256 = hashlib.sha256()
-    file_storage.seek(0)
-    for chunk in iter(lambda: file_storage.read(8192), b""):
-        sha256.update(chunk)
-    file_storage.seek(0)
-    return sha256.hexdigest()[:16]
-
-
-app = Flask(__name__)
-app.config["MAX_CONTENT_LENGTH"] = 50 * 1024 * 1024
 
+def save_upload(file_storage) -> tuple[str, Path]:
+    """Stream an upload to a temporary file, hashing it with BLAKE3 on the way."""
+    fd, tmp_name = tempfile.mkstemp(dir=get_upload_dir(), suffix=".part")
+    tmp_path = Path(tmp_name)
+    digest = blake3()
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while chunk := file_storage.stream.read(256 * 1024):
+                digest.update(chunk)
+                out.write(chunk)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return digest.hexdigest()[:16], tmp_path
+
+
+def save_uploads(file_storages) -> list[tuple[str, Path]]:
+    """Save uploads concurrently; if any fails, remove the ones that were saved."""
+    results = [None] * len(file_storages)
+    error = None
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(file_storages)))) as executor:
+        futures = {
+            executor.submit(save_upload, f): i for i, f in enumerate(file_storages)
+        }
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                error = error or e
 
-_valid_voices = None
+    if error:
+        for result in results:
+            if result:
+                result[1].unlink(missing_ok=True)
+        raise error
+    return results
 
 
-def _get_valid_voices():
-    global _valid_voices
-    if _valid_voices is None:
-        _valid_voices = {v["id"] for v in tts.get_available_voices()}
-    return _valid_voices
+app = Flask(__name__)
+app.config["MAX_CONTENT_LENGTH"] = 50 * 1024 * 1024
 
 
 @app.route("/")
@@ -57,16 +82,15 @@ def process_url():
     if not url:
         return jsonify({"error": "URL is required"}), 400
 
-    if voice not in _get_valid_voices():
-        return jsonify({"error": f"Invalid voice ID: {voice}"}), 400
-
     if len(url) > 2048:
         return jsonify({"error": "URL too long"}), 400
 
-    parsed = urlparse(url)
-    if parsed.scheme not in ("http", "https") or not parsed.netloc:
+    if not _HTTP_URL_RE.match(url):
         return jsonify({"error": "Invalid URL - must be HTTP or HTTPS"}), 400
 
+    if tts.get_voice(voice) is None:
+        return jsonify({"error": f"Invalid voice ID: {voice}"}), 400
+
     title = url if len(url) <= 50 else url[:47] + "..."
 
     article_id = db.create_article(
@@ -90,30 +114,23 @@ def process_text():
     if not text:
         return jsonify({"error": "Text is required"}), 400
 
-    if voice not in _get_valid_voices():
-        return jsonify({"error": f"Invalid voice ID: {voice}"}), 400
-
     if len(text) < 10:
         return jsonify({"error": "Text too short"}), 400
 
-    content_hash = hashlib.sha256(text.encode()).hexdigest()[:16]
+    if tts.get_voice(voice) is None:
+        return jsonify({"error": f"Invalid voice ID: {voice}"}), 400
 
-    txt_filename = f"{content_hash}_raw.txt"
-    txt_path = TEXTS_DIR / txt_filename
-    txt_path.parent.mkdir(parents=True, exist_ok=True)
-    txt_path.write_text(text, encoding="utf-8")
+    content_hash = blake3(text.encode()).hexdigest()[:16]
 
     article_id = db.create_article(
         title=title[:100],
         source_type="text",
         source_path="",
-        txt_path=txt_filename,
         voice=voice,
         content_hash=content_hash,
+        source_text=text,
     )
 
-    db.update_article_stage(article_id, "extracted", raw_txt_path=txt_filename)
-
     worker.notify_new_article()
     return jsonify({"article_id": article_id})
 
@@ -129,21 +146,21 @@ def process_pdf():
     if file.filename == "":
         return jsonify({"error": "No file selected"}), 400
 
-    if voice not in _get_valid_voices():
+    if tts.get_voice(voice) is None:
         return jsonify({"error": f"Invalid voice ID: {voice}"}), 400
 
     if not file.filename.lower().endswith(".pdf"):
         return jsonify({"error": "File must be a PDF"}), 400
 
-    content_hash = compute_file_hash(file)
+    content_hash, tmp_path = save_upload(file)
     existing = db.get_article_by_hash(content_hash)
     if existing:
+        tmp_path.unlink()
         return jsonify({"article_id": existing["id"], "duplicate": True})
 
     filename = secure_filename(file.filename)
     pdf_filename = f"{content_hash}_{filename}"
-    pdf_path = UPLOAD_DIR / pdf_filename
-    file.save(str(pdf_path))
+    tmp_path.replace(get_upload_dir() / pdf_filename)
 
     article_id = db.create_article(
         title=filename.replace(".pdf", ""),
@@ -168,34 +185,40 @@ def import_pdfs():
     if not files or all(f.filename == "" for f in files):
         return jsonify({"error": "No files selected"}), 400
 
-    if voice not in _get_valid_voices():
+    if tts.get_voice(voice) is None:
         return jsonify({"error": f"Invalid voice ID: {voice}"}), 400
 
-    article_ids = []
-    duplicates = []
-    for file in files:
-        if file.filename == "" or not file.filename.lower().endswith(".pdf"):
-            continue
+    pdf_files = [f for f in files if f.filename.lower().endswith(".pdf")]
+    uploads = save_uploads(pdf_files)
 
-        content_hash = compute_file_hash(file)
+    duplicates = []
+    batch_duplicates = []
+    new_articles = {}
+    for file, (content_hash, tmp_path) in zip(pdf_files, uploads):
         existing = db.get_article_by_hash(content_hash)
-        if existing:
-            duplicates.append(existing["id"])
+        if existing or content_hash in new_articles:
+            tmp_path.unlink()
+            if existing:
+                duplicates.append(existing["id"])
+            else:
+                batch_duplicates.append(content_hash)
             continue
 
         filename = secure_filename(file.filename)
         pdf_filename = f"{content_hash}_{filename}"
-        pdf_path = UPLOAD_DIR / pdf_filename
-        file.save(str(pdf_path))
-
-        article_id = db.create_article(
-            title=filename.replace(".pdf", ""),
-            source_type="pdf",
-            source_path=pdf_filename,
-            voice=voice,
-            content_hash=content_hash,
-        )
-        article_ids.append(article_id)
+        tmp_path.replace(get_upload_dir() / pdf_filename)
+
+        new_articles[content_hash] = {
+            "title": filename.replace(".pdf", ""),
+            "source_type": "pdf",
+            "source_path": pdf_filename,
+            "voice": voice,
+            "content_hash": content_hash,
+        }
+
+    article_ids = db.create_articles(list(new_articles.values()))
+    id_by_hash = dict(zip(new_articles, article_ids))
+    duplicates.extend(id_by_hash[h] for h in batch_duplicates)
 
     if article_ids:
         worker.notify_new_article()
@@ -249,14 +272,14 @@ def regenerate_article(article_id):
     if not article.get("cleaned_txt_path"):
         return jsonify({"error": "No text available"}), 400
 
-    cleaned_txt_path = TEXTS_DIR / article["cleaned_txt_path"]
+    cleaned_txt_path = get_texts_dir() / article["cleaned_txt_path"]
     if not cleaned_txt_path.exists():
         return jsonify({"error": "Text file not found"}), 400
 
     data = request.get_json() or {}
     voice = data.get("voice", article.get("voice", "af_heart"))
 
-    if voice not in _get_valid_voices():
+    if tts.get_voice(voice) is None:
         return jsonify({"error": f"Invalid voice ID: {voice}"}), 400
 
     db.reset_article_for_audio(article_id, voice)
@@ -267,7 +290,7 @@ def regenerate_article(article_id):
 @app.route("/articles/status")
 def articles_status():
     articles = db.get_all_articles()
-    return jsonify(articles)
+    return jsonify([dict(article) for article in articles])
 
 
 @app.route("/complete/<int:article_id>", methods=["PUT"])
@@ -289,30 +312,23 @@ def article_endpoint(article_id):
     if request.method == "DELETE":
         for txt_field in ["txt_path", "raw_txt_path", "cleaned_txt_path"]:
             if article.get(txt_field):
-                txt_path = TEXTS_DIR / article[txt_field]
-                if txt_path.exists():
-                    txt_path.unlink()
+                (get_texts_dir() / article[txt_field]).unlink(missing_ok=True)
 
         if article["mp3_path"]:
-            mp3_path = AUDIO_DIR / article["mp3_path"]
-            if mp3_path.exists():
-                mp3_path.unlink()
+            (get_audio_dir() / article["mp3_path"]).unlink(missing_ok=True)
 
         if article["source_type"] == "pdf" and article["source_path"]:
-            pdf_path = UPLOAD_DIR / article["source_path"]
-            if pdf_path.exists():
-                pdf_path.unlink()
+            (get_upload_dir() / article["source_path"]).unlink(missing_ok=True)
 
         db.delete_article(article_id)
         return jsonify({"success": True})
 
-    return jsonify(article)
+    return jsonify(dict(article))
 
 
 @app.route("/preview/voice/<voice_id>")
 def preview_voice(voice_id):
-    voices = {v["id"]: v for v in tts.get_available_voices()}
-    if voice_id not in voices:
+    if tts.get_voice(voice_id) is None:
         return jsonify({"error": "Voice not found"}), 404
 
     try:
@@ -332,10 +348,14 @@ def serve_audio(article_id):
     if not article or not article["mp3_path"]:
         return jsonify({"error": "Audio not found"}), 404
 
-    mp3_path = AUDIO_DIR / article["mp3_path"]
+    mp3_path = get_audio_dir() / article["mp3_path"]
     if not mp3_path.exists():
         return jsonify({"error": "Audio file not found"}), 404
 
+    if _ACCEL_REDIRECT_PREFIX:
+        accel_path = f"{_ACCEL_REDIRECT_PREFIX}/audio/{article['mp3_path']}"
+        return Response(mimetype="audio/mpeg", headers={"X-Accel-Redirect": accel_path})
+
     return send_file(str(mp3_path), mimetype="audio/mpeg")
 
 
@@ -349,7 +369,7 @@ def get_timestamps(article_id):
     if not timestamps_path_name:
         return jsonify({"error": "Timestamps not available"}), 404
 
-    timestamps_path = TIMESTAMPS_DIR / timestamps_path_name
+    timestamps_path = get_timestamps_dir() / timestamps_path_name
     if not timestamps_path.exists():
         return jsonify({"error": "Timestamps file not found"}), 404
 
@@ -359,5 +379,6 @@ def get_timestamps(article_id):
 if __name__ == "__main__":
     setup_logging()
     logger.info("Starting OutLoud server")
+    db.init_db()
     worker.start_worker()
     app.run(debug=True, port=5001, use_reloader=False)
@@ -1,3 +1,4 @@
+import io
 import os
 import tempfile
 from pathlib import Path
@@ -7,8 +8,11 @@ _test_data_dir = tempfile.mkdtemp(prefix="outloud_test_")
 os.environ["OUTLOUD_DATA_DIR"] = _test_data_dir
 
 import pytest  # noqa: E402
+from blake3 import blake3  # noqa: E402
 
 from app import app  # noqa: E402
+from outloud import db  # noqa: E402
+from outloud.config import get_upload_dir  # noqa: E402
 from outloud.tts import (  # noqa: E402
     generate_audio,
     generate_audio_chunked,
@@ -127,6 +131,58 @@ class TestPreviewEndpoint:
         assert response.status_code == 404, "Should return 404 for invalid voice"
 
 
+class TestUploadEndpoints:
+    @pytest.fixture
+    def client(self):
+        app.config["TESTING"] = True
+        with app.test_client() as client:
+            yield client
+
+    def test_pdf_upload_stores_blake3_hash(self, client):
+        pdf_bytes = b"%PDF-1.4 upload test " + os.urandom(16)
+        voice = get_available_voices()[0]["id"]
+
+        response = client.post(
+            "/process/pdf",
+            data={"file": (io.BytesIO(pdf_bytes), "paper.pdf"), "voice": voice},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 200
+        article = db.get_article(response.get_json()["article_id"])
+        assert article["content_hash"] == blake3(pdf_bytes).hexdigest()[:16]
+        assert (get_upload_dir() / article["source_path"]).read_bytes() == pdf_bytes
+        assert not list(get_upload_dir().glob("*.part")), (
+            "Temp upload should be renamed"
+        )
+
+    def test_import_pdfs_dedups_within_batch(self, client):
+        pdf_bytes = b"%PDF-1.4 batch test " + os.urandom(16)
+        content_hash = blake3(pdf_bytes).hexdigest()[:16]
+        voice = get_available_voices()[0]["id"]
+
+        response = client.post(
+            "/import/pdfs",
+            data={
+                "files": [
+                    (io.BytesIO(pdf_bytes), "first.pdf"),
+                    (io.BytesIO(pdf_bytes), "second.pdf"),
+                ],
+                "voice": voice,
+            },
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 200
+        body = response.get_json()
+        assert body["count"] == 1
+        assert body["duplicates"] == body["article_ids"]
+        assert len(list(get_upload_dir().glob(f"{content_hash}_*"))) == 1
+        assert not list(get_upload_dir().glob("*.part")), (
+            "Duplicate temp file should be removed"
+        )
+
+
 if __name__ == "__main__":
     import sys
 
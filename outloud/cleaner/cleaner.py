@@ -1,8 +1,18 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 
 OLLAMA_URL = "http://localhost:11434"
 DEFAULT_MODEL = "llama3.2:1b"
 
+_session = requests.Session()
+_session.mount(
+    "http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+)
+
 CLEANUP_PROMPT = """You are a text editor preparing content for audio narration.
 
 CRITICAL RULES - You MUST follow these:
@@ -32,7 +42,7 @@ Text to clean:
 
 def is_ollama_running() -> bool:
     try:
-        response = requests.get(f"{OLLAMA_URL}/api/tags", timeout=2)
+        response = _session.get(f"{OLLAMA_URL}/api/tags", timeout=2)
         return response.status_code == 200
     except Exception:
         return False
@@ -42,25 +52,42 @@ def cleanup_text(text: str, model: str = DEFAULT_MODEL) -> str:
     if not is_ollama_running():
         raise RuntimeError("Ollama is not running. Start it with: ollama serve")
 
-    response = requests.post(
-        f"{OLLAMA_URL}/api/generate",
-        json={
+    body = json.dumps(
+        {
             "model": model,
             "prompt": CLEANUP_PROMPT + text,
-            "stream": False,
+            "stream": True,
             "options": {
                 "temperature": 0.1,
                 "num_predict": len(text) + 500,
             },
         },
+        ensure_ascii=False,
+    ).encode()
+    response = _session.post(
+        f"{OLLAMA_URL}/api/generate",
+        data=body,
+        headers={"Content-Type": "application/json"},
         timeout=300,
+        stream=True,
     )
 
-    if response.status_code != 200:
-        raise RuntimeError(f"Ollama error: {response.text}")
+    try:
+        if response.status_code != 200:
+            raise RuntimeError(f"Ollama error: {response.text}")
 
-    result = response.json()
-    return result.get("response", "").strip()
+        parts = []
+        for line in response.iter_lines():
+            if not line:
+                continue
+            result = json.loads(line)
+            if "error" in result:
+                raise RuntimeError(f"Ollama error: {result['error']}")
+            parts.append(result.get("response", ""))
+    finally:
+        response.close()
+
+    return "".join(parts).strip()
 
 
 def cleanup_text_chunked(
@@ -68,6 +95,7 @@ def cleanup_text_chunked(
     model: str = DEFAULT_MODEL,
     chunk_size: int = 2000,
     progress_callback=None,
+    concurrency: int = 4,
 ) -> str:
     if not is_ollama_running():
         raise RuntimeError("Ollama is not running. Start it with: ollama serve")
@@ -75,29 +103,41 @@ def cleanup_text_chunked(
     paragraphs = text.split("\n\n")
 
     chunks = []
-    current_chunk = ""
+    current_parts: list[str] = []
+    current_len = 0
     for para in paragraphs:
-        if len(current_chunk) + len(para) < chunk_size:
-            current_chunk += para + "\n\n"
+        if current_len + len(para) < chunk_size:
+            current_parts.append(para)
+            current_len += len(para) + 2
         else:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            current_chunk = para + "\n\n"
-    if current_chunk.strip():
-        chunks.append(current_chunk.strip())
+            if current_parts:
+                chunks.append("\n\n".join(current_parts).strip())
+            current_parts = [para]
+            current_len = len(para) + 2
+    last_chunk = "\n\n".join(current_parts).strip()
+    if last_chunk:
+        chunks.append(last_chunk)
 
     if not chunks:
         chunks = [text]
 
-    cleaned_parts = []
     total = len(chunks)
+    completed = 0
+    lock = threading.Lock()
 
-    for i, chunk in enumerate(chunks):
-        if progress_callback:
-            progress_callback(i + 1, total, f"Cleaning chunk {i + 1}/{total}")
-
+    def clean_chunk(chunk: str) -> str:
+        nonlocal completed
         cleaned = cleanup_text(chunk, model)
-        cleaned_parts.append(cleaned)
+        if progress_callback:
+            with lock:
+                completed += 1
+                progress_callback(
+                    completed, total, f"Cleaned chunk {completed}/{total}"
+                )
+        return cleaned
+
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, total))) as executor:
+        cleaned_parts = list(executor.map(clean_chunk, chunks))
 
     if progress_callback:
         progress_callback(total, total, "Cleanup complete")
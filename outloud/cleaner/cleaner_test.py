@@ -6,39 +6,55 @@ from outloud.cleaner import cleanup_text, cleanup_text_chunked, is_ollama_runnin
 
 
 def test_is_ollama_running_true():
-    with patch("outloud.cleaner.requests.get") as mock_get:
+    with patch("outloud.cleaner.cleaner._session.get") as mock_get:
         mock_get.return_value.status_code = 200
         assert is_ollama_running() is True
 
 
 def test_is_ollama_running_false():
-    with patch("outloud.cleaner.requests.get") as mock_get:
+    with patch("outloud.cleaner.cleaner._session.get") as mock_get:
         mock_get.side_effect = Exception("Connection refused")
         assert is_ollama_running() is False
 
 
 def test_cleanup_text_ollama_not_running():
-    with patch("outloud.cleaner.is_ollama_running", return_value=False):
+    with patch("outloud.cleaner.cleaner.is_ollama_running", return_value=False):
         with pytest.raises(RuntimeError, match="Ollama is not running"):
             cleanup_text("test text")
 
 
 def test_cleanup_text_success():
-    with patch("outloud.cleaner.is_ollama_running", return_value=True):
-        with patch("outloud.cleaner.requests.post") as mock_post:
+    with patch("outloud.cleaner.cleaner.is_ollama_running", return_value=True):
+        with patch("outloud.cleaner.cleaner._session.post") as mock_post:
             mock_post.return_value.status_code = 200
-            mock_post.return_value.json.return_value = {"response": "cleaned text"}
+            mock_post.return_value.iter_lines.return_value = [
+                b'{"response": "cleaned ", "done": false}',
+                b"",
+                b'{"response": "text", "done": true}',
+            ]
 
             result = cleanup_text("raw text")
             assert result == "cleaned text"
 
 
+def test_cleanup_text_stream_error():
+    with patch("outloud.cleaner.cleaner.is_ollama_running", return_value=True):
+        with patch("outloud.cleaner.cleaner._session.post") as mock_post:
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.iter_lines.return_value = [
+                b'{"error": "model not found"}'
+            ]
+
+            with pytest.raises(RuntimeError, match="model not found"):
+                cleanup_text("raw text")
+
+
 def test_cleanup_text_chunked():
     long_text = "Paragraph one.\n\nParagraph two.\n\nParagraph three."
     progress_calls = []
 
-    with patch("outloud.cleaner.is_ollama_running", return_value=True):
-        with patch("outloud.cleaner.cleanup_text") as mock_cleanup:
+    with patch("outloud.cleaner.cleaner.is_ollama_running", return_value=True):
+        with patch("outloud.cleaner.cleaner.cleanup_text") as mock_cleanup:
             mock_cleanup.side_effect = lambda t, m: f"cleaned: {t[:20]}"
 
             result = cleanup_text_chunked(
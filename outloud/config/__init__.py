@@ -1,24 +1,24 @@
 from outloud.config.config import (
-    AUDIO_DIR,
-    DATA_DIR,
-    DB_PATH,
-    TEXTS_DIR,
-    TIMESTAMPS_DIR,
-    UPLOAD_DIR,
     USER_DATA_DIR,
+    get_audio_dir,
     get_data_dir,
+    get_db_path,
+    get_models_dir,
+    get_texts_dir,
+    get_timestamps_dir,
+    get_upload_dir,
 )
 from outloud.config.logging import get_logger, setup_logging
 
 __all__ = [
-    "AUDIO_DIR",
-    "DATA_DIR",
-    "DB_PATH",
-    "TEXTS_DIR",
-    "TIMESTAMPS_DIR",
-    "UPLOAD_DIR",
     "USER_DATA_DIR",
+    "get_audio_dir",
     "get_data_dir",
+    "get_db_path",
     "get_logger",
+    "get_models_dir",
+    "get_texts_dir",
+    "get_timestamps_dir",
+    "get_upload_dir",
     "setup_logging",
 ]
@@ -1,3 +1,4 @@
+import functools
 import os
 from pathlib import Path
 
@@ -10,15 +11,36 @@ def get_data_dir() -> Path:
     return USER_DATA_DIR
 
 
-DATA_DIR = get_data_dir()
-DB_PATH = DATA_DIR / "reader.db"
-TEXTS_DIR = DATA_DIR / "texts"
-AUDIO_DIR = DATA_DIR / "audio"
-UPLOAD_DIR = DATA_DIR / "uploads"
-TIMESTAMPS_DIR = DATA_DIR / "timestamps"
+def _ensure_dir(path: Path) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
-DATA_DIR.mkdir(parents=True, exist_ok=True)
-TEXTS_DIR.mkdir(parents=True, exist_ok=True)
-AUDIO_DIR.mkdir(parents=True, exist_ok=True)
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-TIMESTAMPS_DIR.mkdir(parents=True, exist_ok=True)
+
+@functools.cache
+def get_db_path() -> Path:
+    return _ensure_dir(get_data_dir()) / "reader.db"
+
+
+@functools.cache
+def get_texts_dir() -> Path:
+    return _ensure_dir(get_data_dir() / "texts")
+
+
+@functools.cache
+def get_audio_dir() -> Path:
+    return _ensure_dir(get_data_dir() / "audio")
+
+
+@functools.cache
+def get_upload_dir() -> Path:
+    return _ensure_dir(get_data_dir() / "uploads")
+
+
+@functools.cache
+def get_timestamps_dir() -> Path:
+    return _ensure_dir(get_data_dir() / "timestamps")
+
+
+@functools.cache
+def get_models_dir() -> Path:
+    return _ensure_dir(get_data_dir() / "models")
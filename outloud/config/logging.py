@@ -1,6 +1,8 @@
 import logging
 import os
+import re
 import sys
+import time
 
 
 class ColorFormatter(logging.Formatter):
@@ -14,20 +16,29 @@ class ColorFormatter(logging.Formatter):
     RESET = "\033[0m"
     BOLD = "\033[1m"
     DIM = "\033[2m"
+    TEMPLATE = f"{DIM}%s{RESET} %s {DIM}%-20s{RESET} %s"
+
+    def __init__(self):
+        super().__init__()
+        self._levels = {
+            name: f"{color}{name:8}{self.RESET}" for name, color in self.COLORS.items()
+        }
+        self._last_time = (None, "")
 
     def format(self, record):
-        color = self.COLORS.get(record.levelname, "")
-        reset = self.RESET if color else ""
+        second = int(record.created)
+        cached_second, timestamp = self._last_time
+        if second != cached_second:
+            timestamp = time.strftime("%H:%M:%S", time.localtime(second))
+            self._last_time = (second, timestamp)
 
-        timestamp = self.formatTime(record, "%H:%M:%S")
-        level = f"{color}{record.levelname:8}{reset}"
-        name = f"{self.DIM}{record.name:20}{self.RESET}"
+        level = self._levels.get(record.levelname) or f"{record.levelname:8}"
         message = record.getMessage()
 
         if record.exc_info:
             message += "\n" + self.formatException(record.exc_info)
 
-        return f"{self.DIM}{timestamp}{self.RESET} {level} {name} {message}"
+        return self.TEMPLATE % (timestamp, level, record.name, message)
 
 
 class NoisyLibraryFilter(logging.Filter):
@@ -35,17 +46,21 @@ class NoisyLibraryFilter(logging.Filter):
         "words count mismatch",
         "phonemizer",
     ]
+    NOISY_LOGGERS = ("phonemizer", "kokoro")
 
     def filter(self, record):
-        msg = record.getMessage()
-        if record.name == "werkzeug" and "/articles/status" in msg:
-            return False
-        for pattern in self.NOISE_PATTERNS:
-            if pattern in msg.lower():
-                return False
+        if record.name == "werkzeug":
+            return "/articles/status" not in record.getMessage()
+        if record.name.startswith(self.NOISY_LOGGERS):
+            return _NOISE_RE.search(record.getMessage()) is None
         return True
 
 
+_NOISE_RE = re.compile(
+    "|".join(map(re.escape, NoisyLibraryFilter.NOISE_PATTERNS)), re.IGNORECASE
+)
+
+
 def setup_logging():
     level_name = os.environ.get("OUTLOUD_LOG_LEVEL", "INFO").upper()
     level = getattr(logging, level_name, logging.INFO)
@@ -1,9 +1,13 @@
 from outloud.db.db import (
+    ArticleRow,
     create_article,
+    create_articles,
     delete_article,
     get_all_articles,
     get_article,
     get_article_by_hash,
+    get_article_ids_to_process,
+    get_articles_by_ids,
     get_articles_to_process,
     get_completed_articles,
     get_connection,
@@ -14,18 +18,24 @@ from outloud.db.db import (
     reset_article_for_cleaning,
     reset_article_for_reprocessing,
     set_article_error,
+    transaction,
     update_article_mp3,
     update_article_notes,
     update_article_progress,
     update_article_stage,
+    update_articles_stage,
 )
 
 __all__ = [
+    "ArticleRow",
     "create_article",
+    "create_articles",
     "delete_article",
     "get_all_articles",
     "get_article",
     "get_article_by_hash",
+    "get_article_ids_to_process",
+    "get_articles_by_ids",
     "get_articles_to_process",
     "get_completed_articles",
     "get_connection",
@@ -36,8 +46,10 @@ __all__ = [
     "reset_article_for_cleaning",
     "reset_article_for_reprocessing",
     "set_article_error",
+    "transaction",
     "update_article_mp3",
     "update_article_notes",
     "update_article_progress",
     "update_article_stage",
+    "update_articles_stage",
 ]
@@ -1,17 +1,119 @@
+import atexit
+import functools
+import os
+import queue
 import sqlite3
-from datetime import datetime
+import threading
+from collections.abc import Sequence
+from contextlib import contextmanager
 
-from outloud.config import DB_PATH
+from outloud.config import get_db_path
 
+# Bump whenever the table, migrations or indexes in _create_schema change.
+_SCHEMA_VERSION = 1
 
-def get_connection():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+_conn: sqlite3.Connection | None = None
+_lock = threading.RLock()
+_tx_depth = 0
+_tx_owner: int | None = None
+_readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+_reader_slots = threading.BoundedSemaphore(os.cpu_count() or 4)
+
+
+class ArticleRow(sqlite3.Row):
+    """Row with dict-style get(); convert with dict() only when serializing."""
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except IndexError:
+            return default
+
+
+def _open_connection(database: str, uri: bool = False) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        database, uri=uri, check_same_thread=False, cached_statements=256
+    )
+    conn.row_factory = ArticleRow
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    atexit.register(conn.close)
     return conn
 
 
+def get_connection() -> sqlite3.Connection:
+    """Return the shared write connection, opening it on first use.
+
+    The connection is used from Flask request threads and the worker, so
+    callers must hold _lock while using it.
+    """
+    global _conn
+    with _lock:
+        if _conn is None:
+            conn = _open_connection(str(get_db_path()))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            _create_schema(conn)
+            _conn = conn
+        return _conn
+
+
+@contextmanager
+def _reader():
+    """Borrow a read-only connection; WAL lets these run alongside the writer.
+
+    Inside transaction() the owning thread reads through the writer instead,
+    so it sees its own uncommitted changes.
+    """
+    if _tx_depth and _tx_owner == threading.get_ident():
+        yield _conn
+        return
+    with _reader_slots:
+        try:
+            conn = _readers.get_nowait()
+        except queue.Empty:
+            get_connection()
+            conn = _open_connection(f"{get_db_path().as_uri()}?mode=ro", uri=True)
+        try:
+            yield conn
+        finally:
+            _readers.put(conn)
+
+
+@contextmanager
+def transaction():
+    """Group several write helpers into a single commit, rolling back on error."""
+    global _tx_depth, _tx_owner
+    with _lock:
+        conn = get_connection()
+        _tx_owner = threading.get_ident()
+        _tx_depth += 1
+        try:
+            yield conn
+        except BaseException:
+            if _tx_depth == 1:
+                conn.rollback()
+            raise
+        else:
+            if _tx_depth == 1:
+                conn.commit()
+        finally:
+            _tx_depth -= 1
+
+
+def _commit(conn: sqlite3.Connection):
+    if _tx_depth == 0:
+        conn.commit()
+
+
 def init_db():
-    conn = get_connection()
+    """Create the database and bring its schema up to date, if not done yet."""
+    get_connection()
+
+
+def _create_schema(conn):
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+        return
     conn.execute("""
         CREATE TABLE IF NOT EXISTS articles (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -36,7 +138,17 @@ def init_db():
     """)
     conn.commit()
     _migrate_db(conn)
-    conn.close()
+    conn.executescript("""
+        CREATE INDEX IF NOT EXISTS idx_articles_completed
+            ON articles(completed_at DESC) WHERE status = 'completed';
+        CREATE INDEX IF NOT EXISTS idx_articles_created ON articles(created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_articles_hash ON articles(content_hash);
+        CREATE INDEX IF NOT EXISTS idx_articles_pending
+            ON articles(created_at, processing_stage)
+            WHERE processing_stage NOT IN ('ready', 'completed', 'error');
+    """)
+    conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    conn.commit()
 
 
 def _migrate_db(conn):
@@ -54,32 +166,35 @@ def _migrate_db(conn):
         ("progress", "TEXT"),
         ("was_cleaned", "INTEGER DEFAULT 0"),
         ("timestamps_path", "TEXT"),
+        ("source_text", "TEXT"),
     ]
 
-    for col_name, col_type in migrations:
-        if col_name not in columns:
+    missing = [(name, col_type) for name, col_type in migrations if name not in columns]
+    if missing:
+        conn.execute("BEGIN")
+        for col_name, col_type in missing:
             if not col_name.isidentifier():
                 raise ValueError(f"Invalid column name: {col_name}")
             if not all(c.isalnum() or c in " '_()" for c in col_type):
                 raise ValueError(f"Invalid column type: {col_type}")
             conn.execute(f"ALTER TABLE articles ADD COLUMN {col_name} {col_type}")
 
-    conn.execute("""
-        UPDATE articles
-        SET processing_stage = 'ready',
-            raw_txt_path = txt_path,
-            cleaned_txt_path = txt_path
-        WHERE status = 'ready'
-          AND processing_stage IS NULL
-          AND txt_path IS NOT NULL
-    """)
-
-    conn.execute("""
-        UPDATE articles
-        SET processing_stage = 'completed'
-        WHERE status = 'completed'
-          AND processing_stage IS NULL
-    """)
+        conn.execute("""
+            UPDATE articles
+            SET processing_stage = 'ready',
+                raw_txt_path = txt_path,
+                cleaned_txt_path = txt_path
+            WHERE status = 'ready'
+              AND processing_stage IS NULL
+              AND txt_path IS NOT NULL
+        """)
+
+        conn.execute("""
+            UPDATE articles
+            SET processing_stage = 'completed'
+            WHERE status = 'completed'
+              AND processing_stage IS NULL
+        """)
 
     conn.execute("""
         UPDATE articles
@@ -90,6 +205,43 @@ def _migrate_db(conn):
     conn.commit()
 
 
+_SQL_GET_ARTICLE = "SELECT * FROM articles WHERE id = ?"
+_SQL_GET_BY_HASH = "SELECT * FROM articles WHERE content_hash = ?"
+_LIST_COLUMNS = (
+    "id, title, source_type, source_path, status, processing_stage, progress, error, "
+    "voice, mp3_path, cleaned_txt_path, was_cleaned, created_at, completed_at"
+)
+_SQL_GET_ALL = f"SELECT {_LIST_COLUMNS} FROM articles ORDER BY created_at DESC"
+_SQL_GET_PENDING = f"SELECT {_LIST_COLUMNS} FROM articles WHERE status != 'completed' ORDER BY created_at DESC"
+_SQL_GET_TO_PROCESS = """SELECT * FROM articles
+                         WHERE processing_stage NOT IN ('ready', 'completed', 'error')
+                         ORDER BY created_at ASC"""
+_SQL_GET_IDS_TO_PROCESS = """SELECT id FROM articles
+                             WHERE processing_stage NOT IN ('ready', 'completed', 'error')
+                             ORDER BY created_at ASC"""
+_SQL_GET_IDS_IN_STAGES = """SELECT id FROM articles
+                            WHERE processing_stage NOT IN ('ready', 'completed', 'error')
+                              AND processing_stage IN ({})
+                            ORDER BY created_at ASC"""
+_SQL_GET_COMPLETED = f"SELECT {_LIST_COLUMNS} FROM articles WHERE status = 'completed' ORDER BY completed_at DESC"
+_SQL_UPDATE_PROGRESS = "UPDATE articles SET progress = ? WHERE id = ?"
+
+_INSERT_ARTICLE = """INSERT INTO articles (title, source_type, source_path, txt_path, voice, processing_stage, content_hash, source_text)
+                     VALUES (?, ?, ?, ?, ?, 'queued', ?, ?)"""
+
+
+def _article_row(
+    title: str,
+    source_type: str,
+    source_path: str,
+    txt_path: str | None = None,
+    voice: str = "am_adam",
+    content_hash: str | None = None,
+    source_text: str | None = None,
+) -> tuple:
+    return (title, source_type, source_path, txt_path, voice, content_hash, source_text)
+
+
 def create_article(
     title: str,
     source_type: str,
@@ -97,63 +249,89 @@ def create_article(
     txt_path: str | None = None,
     voice: str = "am_adam",
     content_hash: str | None = None,
+    source_text: str | None = None,
 ) -> int:
-    conn = get_connection()
-    cursor = conn.execute(
-        """INSERT INTO articles (title, source_type, source_path, txt_path, voice, processing_stage, content_hash)
-           VALUES (?, ?, ?, ?, ?, 'queued', ?)""",
-        (title, source_type, source_path, txt_path, voice, content_hash),
-    )
-    article_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    with _lock:
+        conn = get_connection()
+        cursor = conn.execute(
+            _INSERT_ARTICLE,
+            (
+                title,
+                source_type,
+                source_path,
+                txt_path,
+                voice,
+                content_hash,
+                source_text,
+            ),
+        )
+        article_id = cursor.lastrowid
+        _commit(conn)
     return article_id
 
 
-def get_article_by_hash(content_hash: str) -> dict | None:
+def create_articles(articles: list[dict]) -> list[int]:
+    """Insert several articles in one transaction. Each dict takes create_article's arguments."""
+    with _lock:
+        conn = get_connection()
+        conn.executemany(_INSERT_ARTICLE, [_article_row(**a) for a in articles])
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        _commit(conn)
+    return list(range(last_id - len(articles) + 1, last_id + 1)) if articles else []
+
+
+def get_article_by_hash(content_hash: str) -> ArticleRow | None:
     """Find an article by its content hash."""
-    conn = get_connection()
-    row = conn.execute(
-        "SELECT * FROM articles WHERE content_hash = ?", (content_hash,)
-    ).fetchone()
-    conn.close()
-    return dict(row) if row else None
+    with _reader() as conn:
+        return conn.execute(_SQL_GET_BY_HASH, (content_hash,)).fetchone()
+
+
+def get_article(article_id: int) -> ArticleRow | None:
+    with _reader() as conn:
+        return conn.execute(_SQL_GET_ARTICLE, (article_id,)).fetchone()
 
 
-def get_article(article_id: int) -> dict | None:
-    conn = get_connection()
-    row = conn.execute("SELECT * FROM articles WHERE id = ?", (article_id,)).fetchone()
-    conn.close()
-    return dict(row) if row else None
+def get_articles_by_ids(article_ids: list[int]) -> dict[int, ArticleRow]:
+    """Fetch several articles in one query, keyed by id."""
+    if not article_ids:
+        return {}
+    placeholders = ",".join("?" * len(article_ids))
+    with _reader() as conn:
+        rows = conn.execute(
+            f"SELECT * FROM articles WHERE id IN ({placeholders})", article_ids
+        ).fetchall()
+    return {row["id"]: row for row in rows}
 
 
-def get_all_articles() -> list[dict]:
-    conn = get_connection()
-    rows = conn.execute("SELECT * FROM articles ORDER BY created_at DESC").fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+def get_all_articles() -> list[ArticleRow]:
+    """List articles with the columns the UI and worker scans need."""
+    with _reader() as conn:
+        return conn.execute(_SQL_GET_ALL).fetchall()
 
 
-def get_pending_articles() -> list[dict]:
+def get_pending_articles() -> list[ArticleRow]:
     """Get articles that are not completed (for display)."""
-    conn = get_connection()
-    rows = conn.execute(
-        "SELECT * FROM articles WHERE status != 'completed' ORDER BY created_at DESC"
-    ).fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    with _reader() as conn:
+        return conn.execute(_SQL_GET_PENDING).fetchall()
 
 
-def get_articles_to_process() -> list[dict]:
+def get_articles_to_process() -> list[ArticleRow]:
     """Get articles that need processing (not in terminal state)."""
-    conn = get_connection()
-    rows = conn.execute(
-        """SELECT * FROM articles
-           WHERE processing_stage NOT IN ('ready', 'completed', 'error')
-           ORDER BY created_at ASC"""
-    ).fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    with _reader() as conn:
+        return conn.execute(_SQL_GET_TO_PROCESS).fetchall()
+
+
+def get_article_ids_to_process(stages: Sequence[str] = ()) -> list[int]:
+    """Ids of articles needing processing, oldest first, read from the partial index.
+
+    When stages is given, only articles currently in one of those stages are returned.
+    """
+    if stages:
+        sql = _SQL_GET_IDS_IN_STAGES.format(", ".join("?" * len(stages)))
+    else:
+        sql = _SQL_GET_IDS_TO_PROCESS
+    with _reader() as conn:
+        return [row[0] for row in conn.execute(sql, tuple(stages))]
 
 
 _ARTICLE_COLUMNS = frozenset(
@@ -174,6 +352,7 @@ _ARTICLE_COLUMNS = frozenset(
         "progress",
         "was_cleaned",
         "timestamps_path",
+        "source_text",
     ]
 )
 
@@ -196,152 +375,154 @@ def update_article_stage(article_id: int, stage: str, **kwargs):
     if stage not in _VALID_STAGES:
         raise ValueError(f"Invalid processing stage: {stage}")
 
-    conn = get_connection()
-    sets = ["processing_stage = ?"]
-    values = [stage]
+    columns = tuple(sorted(kwargs))
+    sql = _update_stage_sql(columns)
+    with _lock:
+        conn = get_connection()
+        conn.execute(sql, (stage, *(kwargs[c] for c in columns), article_id))
+        _commit(conn)
 
-    for key, value in kwargs.items():
-        if key not in _ARTICLE_COLUMNS:
-            raise ValueError(f"Invalid column name: {key}")
-        sets.append(f"{key} = ?")
-        values.append(value)
 
-    values.append(article_id)
-    conn.execute(
-        f"UPDATE articles SET {', '.join(sets)} WHERE id = ?",
-        values,
-    )
-    conn.commit()
-    conn.close()
+@functools.lru_cache(maxsize=32)
+def _update_stage_sql(columns: tuple[str, ...]) -> str:
+    for column in columns:
+        if column not in _ARTICLE_COLUMNS:
+            raise ValueError(f"Invalid column name: {column}")
+    sets = ", ".join(["processing_stage = ?", *(f"{c} = ?" for c in columns)])
+    return f"UPDATE articles SET {sets} WHERE id = ?"
+
+
+def update_articles_stage(article_ids: list[int], stage: str):
+    """Move several articles to the same processing stage in one commit."""
+    if stage not in _VALID_STAGES:
+        raise ValueError(f"Invalid processing stage: {stage}")
+
+    with _lock:
+        conn = get_connection()
+        conn.executemany(
+            "UPDATE articles SET processing_stage = ? WHERE id = ?",
+            [(stage, article_id) for article_id in article_ids],
+        )
+        _commit(conn)
 
 
 def set_article_error(article_id: int, error_message: str):
     """Mark article as failed with error message."""
-    conn = get_connection()
-    conn.execute(
-        "UPDATE articles SET processing_stage = 'error', error = ? WHERE id = ?",
-        (error_message, article_id),
-    )
-    conn.commit()
-    conn.close()
+    with _lock:
+        conn = get_connection()
+        conn.execute(
+            "UPDATE articles SET processing_stage = 'error', error = ? WHERE id = ?",
+            (error_message, article_id),
+        )
+        _commit(conn)
 
 
 def reset_article_for_reprocessing(article_id: int):
     """Reset article to be reprocessed from the beginning."""
-    conn = get_connection()
-    conn.execute(
-        """UPDATE articles
-           SET processing_stage = 'queued', error = NULL, progress = NULL
-           WHERE id = ?""",
-        (article_id,),
-    )
-    conn.commit()
-    conn.close()
+    with _lock:
+        conn = get_connection()
+        conn.execute(
+            """UPDATE articles
+               SET processing_stage = 'queued', error = NULL, progress = NULL
+               WHERE id = ?""",
+            (article_id,),
+        )
+        _commit(conn)
 
 
 def reset_article_for_cleaning(article_id: int):
     """Reset article to run cleaning stage."""
-    conn = get_connection()
-    conn.execute(
-        """UPDATE articles
-           SET processing_stage = 'extracted',
-               cleaned_txt_path = NULL,
-               mp3_path = NULL,
-               error = NULL,
-               progress = NULL,
-               was_cleaned = 0
-           WHERE id = ?""",
-        (article_id,),
-    )
-    conn.commit()
-    conn.close()
+    with _lock:
+        conn = get_connection()
+        conn.execute(
+            """UPDATE articles
+               SET processing_stage = 'extracted',
+                   cleaned_txt_path = NULL,
+                   mp3_path = NULL,
+                   error = NULL,
+                   progress = NULL,
+                   was_cleaned = 0
+               WHERE id = ?""",
+            (article_id,),
+        )
+        _commit(conn)
 
 
 def reset_article_for_audio(article_id: int, voice: str):
     """Reset article to regenerate audio with a different voice."""
-    conn = get_connection()
-    conn.execute(
-        """UPDATE articles
-           SET processing_stage = 'cleaned',
-               mp3_path = NULL,
-               voice = ?,
-               error = NULL,
-               progress = NULL
-           WHERE id = ?""",
-        (voice, article_id),
-    )
-    conn.commit()
-    conn.close()
+    with _lock:
+        conn = get_connection()
+        conn.execute(
+            """UPDATE articles
+               SET processing_stage = 'cleaned',
+                   mp3_path = NULL,
+                   voice = ?,
+                   error = NULL,
+                   progress = NULL
+               WHERE id = ?""",
+            (voice, article_id),
+        )
+        _commit(conn)
 
 
 def update_article_progress(article_id: int, progress: str):
     """Update the progress text for an article."""
     if not all(c.isalnum() or c in " /()-" for c in progress):
         raise ValueError(f"Invalid progress text: {progress}")
-    conn = get_connection()
-    conn.execute(
-        "UPDATE articles SET progress = ? WHERE id = ?",
-        (progress, article_id),
-    )
-    conn.commit()
-    conn.close()
+    with _lock:
+        conn = get_connection()
+        conn.execute(_SQL_UPDATE_PROGRESS, (progress, article_id))
+        _commit(conn)
 
 
-def get_completed_articles() -> list[dict]:
-    conn = get_connection()
-    rows = conn.execute(
-        "SELECT * FROM articles WHERE status = 'completed' ORDER BY completed_at DESC"
-    ).fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+def get_completed_articles() -> list[ArticleRow]:
+    with _reader() as conn:
+        return conn.execute(_SQL_GET_COMPLETED).fetchall()
 
 
 def update_article_mp3(
     article_id: int, mp3_path: str, timestamps_path: str | None = None
 ):
-    conn = get_connection()
-    if timestamps_path:
-        conn.execute(
-            """UPDATE articles
-               SET mp3_path = ?, timestamps_path = ?, status = 'ready', processing_stage = 'ready'
-               WHERE id = ?""",
-            (mp3_path, timestamps_path, article_id),
-        )
-    else:
-        conn.execute(
-            """UPDATE articles
-               SET mp3_path = ?, status = 'ready', processing_stage = 'ready'
-               WHERE id = ?""",
-            (mp3_path, article_id),
-        )
-    conn.commit()
-    conn.close()
+    with _lock:
+        conn = get_connection()
+        if timestamps_path:
+            conn.execute(
+                """UPDATE articles
+                   SET mp3_path = ?, timestamps_path = ?, status = 'ready', processing_stage = 'ready'
+                   WHERE id = ?""",
+                (mp3_path, timestamps_path, article_id),
+            )
+        else:
+            conn.execute(
+                """UPDATE articles
+                   SET mp3_path = ?, status = 'ready', processing_stage = 'ready'
+                   WHERE id = ?""",
+                (mp3_path, article_id),
+            )
+        _commit(conn)
 
 
 def update_article_notes(article_id: int, notes: str):
-    conn = get_connection()
-    conn.execute("UPDATE articles SET notes = ? WHERE id = ?", (notes, article_id))
-    conn.commit()
-    conn.close()
+    with _lock:
+        conn = get_connection()
+        conn.execute("UPDATE articles SET notes = ? WHERE id = ?", (notes, article_id))
+        _commit(conn)
 
 
 def mark_article_completed(article_id: int):
-    conn = get_connection()
-    conn.execute(
-        """UPDATE articles
-           SET status = 'completed', processing_stage = 'completed', completed_at = ?
-           WHERE id = ?""",
-        (datetime.now().isoformat(), article_id),
-    )
-    conn.commit()
-    conn.close()
+    with _lock:
+        conn = get_connection()
+        conn.execute(
+            """UPDATE articles
+               SET status = 'completed', processing_stage = 'completed', completed_at = CURRENT_TIMESTAMP
+               WHERE id = ?""",
+            (article_id,),
+        )
+        _commit(conn)
 
 
 def delete_article(article_id: int):
-    conn = get_connection()
-    conn.execute("DELETE FROM articles WHERE id = ?", (article_id,))
-    conn.commit()
-    conn.close()
-
-
-init_db()
+    with _lock:
+        conn = get_connection()
+        conn.execute("DELETE FROM articles WHERE id = ?", (article_id,))
+        _commit(conn)
@@ -11,9 +11,13 @@ def test_db():
         import importlib
 
         import outloud.config
+        import outloud.config.config
         import outloud.db
+        import outloud.db.db
 
+        importlib.reload(outloud.config.config)
         importlib.reload(outloud.config)
+        importlib.reload(outloud.db.db)
         importlib.reload(outloud.db)
 
         yield outloud.db
@@ -61,12 +65,28 @@ def test_update_article_stage_invalid_stage(test_db):
         test_db.update_article_stage(article_id, "invalid_stage")
 
 
+def test_update_article_stage_invalid_column(test_db):
+    article_id = test_db.create_article(
+        title="Test", source_type="url", source_path="https://example.com"
+    )
+
+    with pytest.raises(ValueError, match="Invalid column name"):
+        test_db.update_article_stage(article_id, "extracted", id=5)
+
+
 def test_get_articles_to_process(test_db):
     test_db.create_article(title="A", source_type="url", source_path="a")
     test_db.create_article(title="B", source_type="url", source_path="b")
 
     articles = test_db.get_articles_to_process()
     assert len(articles) == 2
+    assert test_db.get_article_ids_to_process() == [a["id"] for a in articles]
+
+    test_db.update_article_stage(articles[1]["id"], "cleaned")
+    assert test_db.get_article_ids_to_process(("queued",)) == [articles[0]["id"]]
+    assert test_db.get_article_ids_to_process(("cleaned", "generating")) == [
+        articles[1]["id"]
+    ]
 
 
 def test_set_article_error(test_db):
@@ -88,3 +108,87 @@ def test_delete_article(test_db):
 
     test_db.delete_article(article_id)
     assert test_db.get_article(article_id) is None
+
+
+def test_source_text_cleared_after_extraction(test_db):
+    article_id = test_db.create_article(
+        title="Pasted", source_type="text", source_path="", source_text="Some text"
+    )
+    assert test_db.get_article(article_id)["source_text"] == "Some text"
+
+    test_db.update_article_stage(
+        article_id, "extracted", raw_txt_path="abc_raw.txt", source_text=None
+    )
+    article = test_db.get_article(article_id)
+    assert article["source_text"] is None
+    assert article["raw_txt_path"] == "abc_raw.txt"
+
+
+def test_create_articles(test_db):
+    article_ids = test_db.create_articles(
+        [
+            {"title": "A", "source_type": "pdf", "source_path": "a.pdf"},
+            {
+                "title": "B",
+                "source_type": "pdf",
+                "source_path": "b.pdf",
+                "voice": "af_sky",
+            },
+        ]
+    )
+
+    assert len(article_ids) == 2
+    assert test_db.get_article(article_ids[0])["title"] == "A"
+    assert test_db.get_article(article_ids[1])["voice"] == "af_sky"
+
+
+def test_mark_article_completed(test_db):
+    article_id = test_db.create_article(
+        title="Test", source_type="url", source_path="https://example.com"
+    )
+
+    test_db.mark_article_completed(article_id)
+
+    article = test_db.get_article(article_id)
+    assert article["status"] == "completed"
+    assert article["completed_at"]
+    assert [a["id"] for a in test_db.get_completed_articles()] == [article_id]
+
+
+def test_transaction_rolls_back_on_error(test_db):
+    article_id = test_db.create_article(
+        title="Test", source_type="url", source_path="https://example.com"
+    )
+
+    with pytest.raises(RuntimeError):
+        with test_db.transaction():
+            test_db.update_article_stage(article_id, "extracting")
+            test_db.update_article_progress(article_id, "Chunk 1/2")
+            assert test_db.get_article(article_id)["processing_stage"] == "extracting"
+            raise RuntimeError("boom")
+
+    article = test_db.get_article(article_id)
+    assert article["processing_stage"] == "queued"
+    assert article["progress"] is None
+
+    with test_db.transaction():
+        test_db.update_article_stage(article_id, "extracting")
+        test_db.update_article_progress(article_id, "Chunk 1/2")
+
+    assert test_db.get_article(article_id)["progress"] == "Chunk 1/2"
+
+
+def test_bulk_fetch_and_stage_update(test_db):
+    ids = [
+        test_db.create_article(title=t, source_type="url", source_path=t)
+        for t in ("a", "b", "c")
+    ]
+
+    test_db.update_articles_stage(ids[:2], "extracted")
+
+    articles = test_db.get_articles_by_ids(ids)
+    assert set(articles) == set(ids)
+    assert articles[ids[0]]["processing_stage"] == "extracted"
+    assert articles[ids[1]]["processing_stage"] == "extracted"
+    assert articles[ids[2]]["processing_stage"] == "queued"
+    assert test_db.get_articles_by_ids([]) == {}
@@ -1,22 +1,105 @@
+import functools
 import re
 from pathlib import Path
 from urllib.parse import urlparse
 
-import trafilatura
-from marker.converters.pdf import PdfConverter
-from marker.models import create_model_dict
+_known_dirs: set[Path] = set()
 
-_marker_converter = None
+_LINK_RE = re.compile(
+    r"(?P<img>!\[.*?\]\(.*?\))"
+    r"|(?P<link>\[(?P<link_text>[^\]]+)\]\([^)]+\))"
+    r"|(?P<esc_link>\\\[(?P<esc_link_text>[^\]]+)\\\])"
+    r"|(?P<ref>\[\\?\[?\d+(?:,\s*\d+)*\\?\]?\])"
+)
 
 
+def _markdown_repl(m: re.Match) -> str:
+    kind = m.lastgroup
+    if kind == "link":
+        return m["link_text"]
+    if kind == "esc_link":
+        return m["esc_link_text"]
+    return ""
+
+
+_CLEANUP_PASSES = (
+    # Remove HTML tags and LaTeX math
+    (
+        ("<", "$"),
+        re.compile(r"<[^>]+>|\$\$[\s\S]*?\$\$|\$[^$]+\$"),
+        "",
+    ),
+    # Remove images, links (keeping their text) and reference markers like
+    # [1], [2,3] or [\[6\]]
+    (("[",), _LINK_RE, _markdown_repl),
+    (("(#page-",), re.compile(r"\(#page-\d+-\d+\)"), ""),
+    # Remove URLs, email addresses, DOIs and ISBNs
+    (
+        ("://", "@", "doi.org/", "DOI", "ISBN"),
+        re.compile(
+            r"https?://[^\s]{1,2048}"
+            r"|[^\s@]{1,64}@[^\s@]{1,64}\.[^\s@]{1,24}"
+            r"|doi\.org/[^\s]{1,256}"
+            r"|DOI:?\s*[^\s]{1,256}"
+            r"|ISBN[:\s]*[\d-]+"
+        ),
+        "",
+    ),
+    # Remove academic paper boilerplate, section labels and captions
+    (
+        (
+            "Permission to make",
+            "©",
+            "ACM ",
+            "CCS CONCEPTS",
+            "KEYWORDS",
+            "ABSTRACT",
+            "Figure ",
+            "Table ",
+        ),
+        re.compile(
+            r"(?s:Permission to make digital or hard copies.*?owner/author\(s\)\.)"
+            r"|(?s:©\s*\d{4}.*?(?=\n\n|\Z))"
+            r"|ACM ISBN.*?(?=\n)"
+            r"|(?s:ACM Reference Format:.*?(?=\n\n))"
+            r"|(?m:^(?:CCS CONCEPTS|KEYWORDS|ABSTRACT)[.\s]*$)"
+            r"|(?m:^(?:Figure|Table) \d+:.*$)"
+        ),
+        "",
+    ),
+    # Remove horizontal rules and code blocks, then inline code
+    (
+        ("---", "***", "```"),
+        re.compile(r"^(?:-{3,}|\*{3,})$|```[\s\S]*?```", re.MULTILINE),
+        "",
+    ),
+    (("`",), re.compile(r"`[^`]+`"), ""),
+    # Convert headers to plain text with pause
+    (("#",), re.compile(r"^#{1,6}\s+(.+)$", re.MULTILINE), r"\n\1.\n"),
+    # Remove bullet points
+    ((), re.compile(r"^\s*[-*•]\s+", re.MULTILINE), ""),
+    # Remove numbered list formatting and parenthetical asides like (1) or (a)
+    ((), re.compile(r"^\s*\d+\.\s+|\((?:\d+|[a-z])\)", re.MULTILINE), ""),
+    # Clean up whitespace
+    (("  ", "\t"), re.compile(r"[ \t]{2,}|\t"), " "),
+)
+
+_TITLE_HASH_RE = re.compile(r"^#+\s*")
+_TITLE_STAR_RE = re.compile(r"\*+")
+_TITLE_SEPARATOR_RE = re.compile(r"[_-]+")
+
+
+@functools.cache
 def _get_marker_converter():
-    global _marker_converter
-    if _marker_converter is None:
-        _marker_converter = PdfConverter(artifact_dict=create_model_dict())
-    return _marker_converter
+    from marker.converters.pdf import PdfConverter
+    from marker.models import create_model_dict
+
+    return PdfConverter(artifact_dict=create_model_dict())
 
 
 def extract_from_url(url: str) -> tuple[str, str]:
+    import trafilatura
+
     downloaded = trafilatura.fetch_url(url)
     if not downloaded:
         raise ValueError(f"Could not fetch URL: {url}")
@@ -29,8 +112,7 @@ def extract_from_url(url: str) -> tuple[str, str]:
     if metadata and metadata.title:
         title = metadata.title
     else:
-        parsed = urlparse(url)
-        title = parsed.netloc.replace("www.", "")
+        title = urlparse(url).netloc.removeprefix("www.")
 
     return title, text
 
@@ -42,107 +124,59 @@ def extract_from_pdf(pdf_path: str) -> tuple[str, str]:
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
     converter = _get_marker_converter()
-    rendered = converter(str(path))
-
-    text = rendered.markdown
+    text = converter(str(path)).markdown
 
     if not text or len(text.strip()) < 50:
         raise ValueError(f"Could not extract text from PDF: {pdf_path}")
 
     text = clean_markdown_for_tts(text)
     title = extract_title_from_text(text) or path.stem
-    title = re.sub(r"[_-]+", " ", title).strip()
+    title = _TITLE_SEPARATOR_RE.sub(" ", title).strip()
 
     return title, text
 
 
 def clean_markdown_for_tts(text: str) -> str:
-    # Remove HTML tags and spans
-    text = re.sub(r"<[^>]+>", "", text)
+    for needles, pattern, repl in _CLEANUP_PASSES:
+        if not needles or any(needle in text for needle in needles):
+            text = pattern.sub(repl, text)
+    return _collapse_blank_lines(text).strip()
 
-    # Remove LaTeX math blocks
-    text = re.sub(r"\$\$[\s\S]*?\$\$", "", text)
-    text = re.sub(r"\$[^$]+\$", "", text)
-
-    # Remove image references
-    text = re.sub(r"!\[.*?\]\(.*?\)", "", text)
-
-    # Remove markdown links but keep text (handles escaped brackets too)
-    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-    text = re.sub(r"\\\[([^\]]+)\\\]", r"\1", text)
-
-    # Remove reference markers like [1], [2,3], [\[6\]], etc.
-    text = re.sub(r"\[\\?\[?\d+(?:,\s*\d+)*\\?\]?\]", "", text)
-    text = re.sub(r"\(#page-\d+-\d+\)", "", text)
-
-    # Remove URLs and email addresses
-    text = re.sub(r"https?://[^\s]+", "", text)
-    text = re.sub(r"\S+@\S+\.\S+", "", text)
-
-    # Remove DOIs and ISBNs
-    text = re.sub(r"doi\.org/[^\s]+", "", text)
-    text = re.sub(r"DOI:?\s*[^\s]+", "", text)
-    text = re.sub(r"ISBN[:\s]*[\d-]+", "", text)
-
-    # Remove academic paper boilerplate
-    text = re.sub(
-        r"Permission to make digital or hard copies.*?owner/author\(s\)\.",
-        "",
-        text,
-        flags=re.DOTALL,
-    )
-    text = re.sub(r"©\s*\d{4}.*?(?=\n\n|\Z)", "", text, flags=re.DOTALL)
-    text = re.sub(r"ACM ISBN.*?(?=\n)", "", text)
-    text = re.sub(r"ACM Reference Format:.*?(?=\n\n)", "", text, flags=re.DOTALL)
-
-    # Remove section labels that don't read well
-    text = re.sub(
-        r"^(CCS CONCEPTS|KEYWORDS|ABSTRACT)[.\s]*$", "", text, flags=re.MULTILINE
-    )
-    text = re.sub(r"^Figure \d+:.*$", "", text, flags=re.MULTILINE)
-    text = re.sub(r"^Table \d+:.*$", "", text, flags=re.MULTILINE)
-
-    # Remove horizontal rules
-    text = re.sub(r"^-{3,}$", "", text, flags=re.MULTILINE)
-    text = re.sub(r"^\*{3,}$", "", text, flags=re.MULTILINE)
-
-    # Remove code blocks
-    text = re.sub(r"```[\s\S]*?```", "", text)
-    text = re.sub(r"`[^`]+`", "", text)
-
-    # Convert headers to plain text with pause
-    text = re.sub(r"^#{1,6}\s+(.+)$", r"\n\1.\n", text, flags=re.MULTILINE)
-
-    # Remove bullet points and numbered lists formatting
-    text = re.sub(r"^\s*[-*•]\s+", "", text, flags=re.MULTILINE)
-    text = re.sub(r"^\s*\d+\.\s+", "", text, flags=re.MULTILINE)
-
-    # Remove parenthetical asides with just numbers/letters
-    text = re.sub(r"\(\d+\)", "", text)
-    text = re.sub(r"\([a-z]\)", "", text)
-
-    # Clean up whitespace
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = re.sub(r"^\s+$", "", text, flags=re.MULTILINE)
 
-    return text.strip()
+def _collapse_blank_lines(text: str) -> str:
+    """Blank out whitespace-only lines and squeeze each run of them to one."""
+    lines = []
+    previous_blank = False
+    for line in text.split("\n"):
+        blank = not line or line.isspace()
+        if not (blank and previous_blank):
+            lines.append("" if blank else line)
+        previous_blank = blank
+    return "\n".join(lines)
 
 
 def extract_title_from_text(text: str) -> str | None:
-    lines = text.strip().split("\n")
-    for line in lines[:5]:
+    for line in text.lstrip().split("\n", 5)[:5]:
         line = line.strip()
         if len(line) > 10 and len(line) < 200:
-            title = re.sub(r"^#+\s*", "", line)
-            title = re.sub(r"\*+", "", title)
+            title = _TITLE_HASH_RE.sub("", line)
+            title = _TITLE_STAR_RE.sub("", title)
             if title:
                 return title
     return None
 
 
 def save_text(text: str, output_path: str) -> str:
+    """Write text atomically so a crash never leaves a truncated file behind."""
     path = Path(output_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
+    if path.parent not in _known_dirs:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _known_dirs.add(path.parent)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(text.encode("utf-8"))
+        tmp_path.replace(path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
     return str(path)
@@ -55,6 +55,35 @@ Figure 1: A caption to remove.
     assert "paragraph" in cleaned
 
 
+def test_clean_markdown_for_tts_plain_text():
+    text = "Just a plain sentence.\n\nAnd another one, costing $5."
+    assert clean_markdown_for_tts(text) == text
+
+
+def test_clean_markdown_for_tts_header_before_bullets():
+    markdown = "# Results\n- first point\n- second point\n"
+    assert clean_markdown_for_tts(markdown) == "Results.\nfirst point\nsecond point"
+
+
+def test_clean_markdown_for_tts_structure_after_boilerplate():
+    assert clean_markdown_for_tts("## ABSTRACT\n\nBody.") == "ABSTRACT.\n\nBody."
+    assert clean_markdown_for_tts("- Figure 1: cap\n- other") == "Figure 1: cap\nother"
+    assert clean_markdown_for_tts("## Results at http://example.com") == "Results at ."
+
+
+def test_clean_markdown_for_tts_nested_emphasis():
+    markdown = (
+        "# **Bold *and italic* header**\n"
+        "* *italic bullet* with `code` inside\n\n"
+        "**[a *nested* link](http://example.com)** ends ***here***."
+    )
+    assert clean_markdown_for_tts(markdown) == (
+        "**Bold *and italic* header**.\n"
+        "*italic bullet* with inside\n\n"
+        "**a *nested* link** ends ***here***."
+    )
+
+
 def test_extract_title_from_text():
     text = """
 Short.
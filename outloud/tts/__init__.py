@@ -5,6 +5,7 @@ from outloud.tts.tts import (
     generate_preview,
     get_available_voices,
     get_kokoro,
+    get_voice,
     split_into_chunks,
 )
 
@@ -15,5 +16,6 @@ __all__ = [
     "generate_preview",
     "get_available_voices",
     "get_kokoro",
+    "get_voice",
     "split_into_chunks",
 ]
@@ -1,12 +1,19 @@
 import ctypes
+import functools
 import glob
-import io
+import itertools
 import os
 import platform
 import re
+import subprocess
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable
+from types import MappingProxyType
+from typing import Callable, Iterable, Iterator, Mapping, TypeVar
 
 try:
     from python.runfiles import runfiles
@@ -20,14 +27,18 @@ SAMPLE_RATE = 24000
 
 
 def _configure_espeak():
+    if os.environ.get("ESPEAK_DATA_PATH"):
+        return
     system = platform.system()
     if system == "Darwin":
-        paths = [
-            "/opt/homebrew/share/espeak-ng-data",
-            "/usr/local/share/espeak-ng-data",
-        ]
-        paths.extend(glob.glob("/opt/homebrew/Cellar/espeak-ng/*/share/espeak-ng-data"))
-        paths.extend(glob.glob("/usr/local/Cellar/espeak-ng/*/share/espeak-ng-data"))
+        paths = itertools.chain(
+            [
+                "/opt/homebrew/share/espeak-ng-data",
+                "/usr/local/share/espeak-ng-data",
+            ],
+            glob.iglob("/opt/homebrew/Cellar/espeak-ng/*/share/espeak-ng-data"),
+            glob.iglob("/usr/local/Cellar/espeak-ng/*/share/espeak-ng-data"),
+        )
         for path in paths:
             if Path(path).exists():
                 os.environ["ESPEAK_DATA_PATH"] = path
@@ -69,12 +80,13 @@ _configure_espeak()
 
 import numpy as np  # noqa: E402
 import onnxruntime as ort  # noqa: E402
-import soundfile as sf  # noqa: E402
 from kokoro_onnx import Kokoro  # noqa: E402
 from misaki import en, espeak  # noqa: E402
-from pydub import AudioSegment  # noqa: E402
+
+from outloud.config import get_models_dir  # noqa: E402
 
 _BITRATE = "192k"
+_TTS_WORKERS = max(1, int(os.environ.get("OUTLOUD_TTS_WORKERS", "2")))
 
 
 def _get_vocab() -> dict[str, int]:
@@ -88,6 +100,7 @@ def _get_vocab() -> dict[str, int]:
 
 _VOCAB = _get_vocab()
 _g2p = None
+_espeak_lock = threading.Lock()
 
 
 def _get_g2p():
@@ -108,37 +121,40 @@ def _calculate_word_timestamps(
     if not tokens or len(pred_dur) < 3:
         return []
 
+    durations = pred_dur.astype(np.float64)
+    offsets = np.concatenate(([0.0], np.cumsum(durations))).tolist()
+    durations = durations.tolist()
+    n = len(durations)
+
     timestamps = []
-    left = right = 2 * max(0.0, float(pred_dur[0]) - 3.0)
+    left = right = 2 * max(0.0, durations[0] - 3.0)
     i = 1
 
     for token in tokens:
-        if i >= len(pred_dur) - 1:
+        if i >= n - 1:
             break
-        if not hasattr(token, "phonemes") or not token.phonemes:
-            if hasattr(token, "whitespace") and token.whitespace:
+        phonemes = getattr(token, "phonemes", None)
+        whitespace = getattr(token, "whitespace", None)
+        if not phonemes:
+            if whitespace:
                 i += 1
-                if i < len(pred_dur):
-                    left = right + float(pred_dur[i])
-                    right = left + float(pred_dur[i])
+                if i < n:
+                    left = right + durations[i]
+                    right = left + durations[i]
                     i += 1
             continue
 
-        j = i + len(token.phonemes)
-        if j >= len(pred_dur):
+        j = i + len(phonemes)
+        if j >= n:
             break
 
         start_ts = left / MAGIC_DIVISOR / speed
-        token_dur = float(pred_dur[i:j].sum())
-        space_dur = (
-            float(pred_dur[j])
-            if (hasattr(token, "whitespace") and token.whitespace)
-            else 0.0
-        )
+        token_dur = offsets[j] - offsets[i]
+        space_dur = durations[j] if whitespace else 0.0
         left = right + (2 * token_dur) + space_dur
         end_ts = left / MAGIC_DIVISOR / speed
         right = left + space_dur
-        i = j + (1 if (hasattr(token, "whitespace") and token.whitespace) else 0)
+        i = j + (1 if whitespace else 0)
 
         word_text = token.text if hasattr(token, "text") else str(token)
         timestamps.append({"word": word_text, "start": start_ts, "end": end_ts})
@@ -146,17 +162,39 @@ def _calculate_word_timestamps(
     return timestamps
 
 
-def _load_voice_data(voices_path: Path) -> dict[str, np.ndarray]:
+def _load_voice_data(voices_path: Path) -> Mapping[str, np.ndarray]:
     data = np.load(str(voices_path), allow_pickle=True)
     if isinstance(data, np.ndarray) and data.dtype == object:
         return data.item()
-    return dict(data)
+    return data
+
+
+_MODEL_NAMES_BY_PRECISION = {
+    "int8": "kokoro-v1.0.int8.onnx",
+    "fp16": "kokoro-v1.0.fp16.onnx",
+    "fp32": "kokoro-v1.0.onnx",
+}
+
+
+def _model_names() -> tuple[str, ...]:
+    precision = os.environ.get("OUTLOUD_TTS_PRECISION")
+    if not precision:
+        return (_MODEL_NAMES_BY_PRECISION["int8"], _MODEL_NAMES_BY_PRECISION["fp32"])
+    if precision not in _MODEL_NAMES_BY_PRECISION:
+        raise ValueError(f"Invalid OUTLOUD_TTS_PRECISION: {precision}")
+    return (_MODEL_NAMES_BY_PRECISION[precision],)
 
 
 def _find_model_paths() -> tuple[Path, Path, Path | None]:
+    model_names = _model_names()
     timestamped_path = None
     if _runfiles:
         model_path = _runfiles.Rlocation("kokoro_model/file/kokoro-v1.0.onnx")
+        if model_path and "kokoro-v1.0.onnx" not in model_names:
+            raise RuntimeError(
+                "OUTLOUD_TTS_PRECISION only applies outside Bazel; "
+                "the Bazel build ships the fp32 model only."
+            )
         voices_path = _runfiles.Rlocation("kokoro_voices/file/voices-v1.0.bin")
         ts_path = _runfiles.Rlocation(
             "kokoro_model_timestamped/file/kokoro-v1.0-timestamped.onnx"
@@ -166,9 +204,9 @@ def _find_model_paths() -> tuple[Path, Path, Path | None]:
         if model_path and voices_path:
             return Path(model_path), Path(voices_path), timestamped_path
     for base in [Path.cwd(), Path(__file__).parent, Path.home() / ".outloud"]:
-        model = base / "kokoro-v1.0.onnx"
+        model = next((base / n for n in model_names if (base / n).exists()), None)
         voices = base / "voices-v1.0.bin"
-        if model.exists() and voices.exists():
+        if model and voices.exists():
             ts = base / "kokoro-v1.0-timestamped.onnx"
             return model, voices, ts if ts.exists() else None
     raise RuntimeError(
@@ -178,54 +216,160 @@ def _find_model_paths() -> tuple[Path, Path, Path | None]:
 
 MODEL_PATH, VOICES_PATH, TIMESTAMPED_MODEL_PATH = _find_model_paths()
 _kokoro = None
+_session_lock = threading.Lock()
+
+
+@functools.cache
+def _register_shared_allocator() -> None:
+    ort.create_and_register_allocator(
+        ort.OrtMemoryInfo(
+            "Cpu", ort.OrtAllocatorType.ORT_ARENA_ALLOCATOR, 0, ort.OrtMemType.DEFAULT
+        ),
+        ort.OrtArenaCfg(0, -1, -1, -1),
+    )
+
+
+_SERIALIZABLE_PROVIDERS = frozenset({"CPUExecutionProvider", "CUDAExecutionProvider"})
+
+
+@functools.cache
+def _session_providers() -> tuple[str, ...]:
+    if provider := os.environ.get("ONNX_PROVIDER"):
+        return (provider,)
+    if "CUDAExecutionProvider" in ort.get_available_providers():
+        return ("CUDAExecutionProvider", "CPUExecutionProvider")
+    return ("CPUExecutionProvider",)
+
+
+def _optimized_model_path(model_path: Path, provider: str) -> Path:
+    stat = model_path.stat()
+    name = (
+        f"{model_path.stem}-{stat.st_size}-{stat.st_mtime_ns}"
+        f"-{provider}-ort{ort.__version__}.onnx"
+    )
+    return get_models_dir() / name
+
+
+def _remove_stale_optimized_models(model_path: Path, keep: Path) -> None:
+    pattern = re.compile(rf"{re.escape(model_path.stem)}-\d+-.+\.onnx")
+    for path in keep.parent.glob(f"{model_path.stem}-*.onnx"):
+        if path != keep and pattern.fullmatch(path.name):
+            path.unlink(missing_ok=True)
+
+
+def _create_session(model_path: Path) -> ort.InferenceSession:
+    """Open a session that allocates from the arena shared by all Kokoro models.
+
+    Each session has up to _TTS_WORKERS runs in flight, so its intra-op pool
+    is sized to that share of the cores instead of every core.
+
+    For CPU and CUDA the graph-optimized model is saved on first load and
+    reused afterwards so later startups skip graph optimization. Writing a
+    new one removes those saved for older model files, providers or ONNX
+    Runtime versions. Providers that compile nodes, such as CoreML and
+    DirectML, cannot be serialized.
+    """
+    _register_shared_allocator()
+    options = ort.SessionOptions()
+    options.add_session_config_entry("session.use_env_allocators", "1")
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    options.intra_op_num_threads = max(1, (os.cpu_count() or 1) // _TTS_WORKERS)
+    providers = _session_providers()
+    if providers[0] not in _SERIALIZABLE_PROVIDERS:
+        return ort.InferenceSession(
+            str(model_path), sess_options=options, providers=providers
+        )
+
+    optimized_path = _optimized_model_path(model_path, providers[0])
+    if optimized_path.exists():
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+        return ort.InferenceSession(
+            str(optimized_path), sess_options=options, providers=providers
+        )
+
+    fd, tmp_name = tempfile.mkstemp(dir=optimized_path.parent, suffix=".onnx.tmp")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    options.optimized_model_filepath = tmp_name
+    try:
+        session = ort.InferenceSession(
+            str(model_path), sess_options=options, providers=providers
+        )
+        if tmp_path.stat().st_size:
+            tmp_path.replace(optimized_path)
+            _remove_stale_optimized_models(model_path, optimized_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return session
 
 
 def get_kokoro() -> Kokoro:
     global _kokoro
-    if _kokoro is None:
-        _kokoro = Kokoro(str(MODEL_PATH), str(VOICES_PATH))
+    with _session_lock:
+        if _kokoro is None:
+            _kokoro = Kokoro.from_session(_create_session(MODEL_PATH), str(VOICES_PATH))
     return _kokoro
 
 
+_SENTENCE_SPLIT_RE = re.compile(
+    r"(?<=[.!?])"
+    r"(?<!\bMr)(?<!\bMrs)(?<!\bDr)(?<!\bMs)(?<!\bProf)(?<!\bSr)(?<!\bJr)(?<!\bvs)(?<!\betc)(?<!\be\.g)(?<!\bi\.e)(?<!\bNo)(?<!\bSt)"
+    r'\s+(?=[A-Z"\']|$)'
+)
+_CLAUSE_SPLIT_RE = re.compile(r"[,;:]\s+")
+
+
 def split_into_chunks(text: str, max_chars: int = 250) -> list[str]:
     """Split text into chunks that are conservative for the TTS phoneme limit."""
-    abbreviations = r"(?<!\bMr)(?<!\bMrs)(?<!\bDr)(?<!\bMs)(?<!\bProf)(?<!\bSr)(?<!\bJr)(?<!\bvs)(?<!\betc)(?<!\be\.g)(?<!\bi\.e)(?<!\bNo)(?<!\bSt)"
-    pattern = abbreviations + r'(?<=[.!?])\s+(?=[A-Z"\']|$)'
-    sentences = [s.strip() for s in re.split(pattern, text) if s.strip()]
+    sentences = _split_into_sentences(text)
 
     chunks = []
-    current_chunk = ""
+    current_parts: list[str] = []
+    current_len = 0
 
     for sentence in sentences:
-        if len(current_chunk) + len(sentence) + 1 <= max_chars:
-            current_chunk += sentence + " "
+        if current_len + len(sentence) + 1 <= max_chars:
+            current_parts.append(sentence)
+            current_len += len(sentence) + 1
         else:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
+            if current_parts:
+                chunks.append(" ".join(current_parts))
             if len(sentence) > max_chars:
-                parts = re.split(r"[,;:]\s+", sentence)
+                parts = _CLAUSE_SPLIT_RE.split(sentence)
                 for part in parts:
                     if len(part) <= max_chars:
                         chunks.append(part.strip())
                     else:
                         for i in range(0, len(part), max_chars):
                             chunks.append(part[i : i + max_chars].strip())
-                current_chunk = ""
+                current_parts = []
+                current_len = 0
             else:
-                current_chunk = sentence + " "
+                current_parts = [sentence]
+                current_len = len(sentence) + 1
 
-    if current_chunk.strip():
-        chunks.append(current_chunk.strip())
+    if current_parts:
+        chunks.append(" ".join(current_parts))
 
     return [c for c in chunks if c] if chunks else [text]
 
 
 def _generate_chunk_audio(
-    kokoro, chunk: str, voice: str, speed: float, max_retries: int = 3
+    kokoro,
+    chunk: str,
+    voice: str,
+    speed: float,
+    max_retries: int = 3,
+    phonemes: str | None = None,
 ):
     """Generate audio for a single chunk, retrying with smaller pieces if needed."""
     try:
-        samples, sample_rate = kokoro.create(chunk, voice=voice, speed=speed)
+        if phonemes is None:
+            with _espeak_lock:
+                phonemes = kokoro.tokenizer.phonemize(chunk, "en-us")
+        samples, sample_rate = kokoro.create(
+            phonemes, voice=voice, speed=speed, is_phonemes=True
+        )
         return samples, sample_rate
     except IndexError as e:
         if "510" in str(e) and max_retries > 0:
@@ -248,6 +392,86 @@ def _generate_chunk_audio(
         raise
 
 
+def _ffmpeg_mp3_command(output: str) -> list[str]:
+    return [
+        "ffmpeg",
+        "-y",
+        "-loglevel",
+        "error",
+        "-f",
+        "f32le",
+        "-ar",
+        str(SAMPLE_RATE),
+        "-ac",
+        "1",
+        "-i",
+        "pipe:0",
+        "-b:a",
+        _BITRATE,
+        "-f",
+        "mp3",
+        output,
+    ]
+
+
+@contextmanager
+def _chunk_executor():
+    """Synthesize chunks concurrently; pending chunks are dropped on failure."""
+    executor = ThreadPoolExecutor(
+        max_workers=_TTS_WORKERS, thread_name_prefix="tts-chunks"
+    )
+    try:
+        yield executor
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+_C = TypeVar("_C")
+_T = TypeVar("_T")
+
+
+def _synthesize_in_order(
+    executor: ThreadPoolExecutor, synthesize: Callable[[_C], _T], chunks: Iterable[_C]
+) -> Iterator[_T]:
+    """Yield results in chunk order with at most 2 * _TTS_WORKERS chunks in flight."""
+    remaining = iter(chunks)
+    pending = deque(
+        executor.submit(synthesize, chunk)
+        for chunk in itertools.islice(remaining, 2 * _TTS_WORKERS)
+    )
+    while pending:
+        future = pending.popleft()
+        for chunk in itertools.islice(remaining, 1):
+            pending.append(executor.submit(synthesize, chunk))
+        yield future.result()
+
+
+@contextmanager
+def _mp3_encoder(output_path: Path):
+    """Yield a writer that streams float32 PCM chunks into ffmpeg as they arrive."""
+    proc = subprocess.Popen(
+        _ffmpeg_mp3_command(str(output_path)),
+        stdin=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+    def write(samples: np.ndarray) -> None:
+        proc.stdin.write(samples.astype(np.float32, copy=False).tobytes())
+
+    try:
+        yield write
+    except Exception:
+        proc.kill()
+        proc.wait()
+        output_path.unlink(missing_ok=True)
+        raise
+
+    _, stderr = proc.communicate()
+    if proc.returncode != 0:
+        output_path.unlink(missing_ok=True)
+        raise RuntimeError(f"ffmpeg failed: {stderr.decode(errors='replace').strip()}")
+
+
 def generate_audio_chunked(
     text: str,
     output_path: str,
@@ -261,30 +485,21 @@ def generate_audio_chunked(
 
     chunks = split_into_chunks(text)
     total_chunks = len(chunks)
-    all_samples = []
-    sample_rate = 24000
-
-    for i, chunk in enumerate(chunks):
-        if progress_callback:
-            progress_callback(
-                i + 1, total_chunks, f"Processing chunk {i + 1}/{total_chunks}"
-            )
-        samples, sample_rate = _generate_chunk_audio(kokoro, chunk, voice, speed)
-        all_samples.append(samples)
-
-    if progress_callback:
-        progress_callback(total_chunks, total_chunks, "Combining audio...")
 
-    combined = np.concatenate(all_samples)
-    wav_path = output_path.with_suffix(".wav")
-    sf.write(str(wav_path), combined, sample_rate)
-
-    if progress_callback:
-        progress_callback(total_chunks, total_chunks, "Converting to MP3...")
+    with _chunk_executor() as executor, _mp3_encoder(output_path) as write_pcm:
+        synthesize = functools.partial(
+            _generate_chunk_audio, kokoro, voice=voice, speed=speed
+        )
+        results = _synthesize_in_order(executor, synthesize, chunks)
+        for i, (samples, _) in enumerate(results):
+            if progress_callback:
+                progress_callback(
+                    i + 1, total_chunks, f"Processing chunk {i + 1}/{total_chunks}"
+                )
+            write_pcm(samples)
 
-    audio = AudioSegment.from_wav(str(wav_path))
-    audio.export(str(output_path), format="mp3", bitrate=_BITRATE)
-    wav_path.unlink()
+        if progress_callback:
+            progress_callback(total_chunks, total_chunks, "Converting to MP3...")
 
     if progress_callback:
         progress_callback(total_chunks, total_chunks, "Complete!")
@@ -302,31 +517,28 @@ def generate_preview(voice: str, speed: float = 1.0) -> bytes:
     """Generate a short voice preview and return MP3 bytes."""
     kokoro = get_kokoro()
 
-    voices = {v["id"]: v for v in get_available_voices()}
-    if voice not in voices:
+    voice_info = get_voice(voice)
+    if voice_info is None:
         raise ValueError(f"Invalid voice ID: {voice}")
-    voice_info = voices[voice]
     preview_text = f"Hi, I'm {voice_info['name']}. I'll be reading your articles."
 
-    samples, sample_rate = kokoro.create(preview_text, voice=voice, speed=speed)
-
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as wav_file:
-        wav_path = wav_file.name
-
-    try:
-        sf.write(wav_path, samples, sample_rate)
-        audio = AudioSegment.from_wav(wav_path)
-    finally:
-        Path(wav_path).unlink(missing_ok=True)
+    samples, _ = _generate_chunk_audio(kokoro, preview_text, voice, speed)
 
-    mp3_buffer = io.BytesIO()
-    audio.export(mp3_buffer, format="mp3", bitrate=_BITRATE)
-    mp3_buffer.seek(0)
-    return mp3_buffer.read()
+    result = subprocess.run(
+        _ffmpeg_mp3_command("pipe:1"),
+        input=samples.astype(np.float32, copy=False).tobytes(),
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg failed: {result.stderr.decode(errors='replace').strip()}"
+        )
+    return result.stdout
 
 
-def get_available_voices() -> list[dict]:
-    return [
+@functools.cache
+def get_available_voices() -> tuple[Mapping[str, str], ...]:
+    voices = [
         {"id": "am_adam", "name": "Adam", "lang": "American English", "gender": "Male"},
         {
             "id": "am_michael",
@@ -384,55 +596,79 @@ def get_available_voices() -> list[dict]:
             "gender": "Male",
         },
     ]
+    return tuple(MappingProxyType(v) for v in voices)
+
+
+@functools.cache
+def _voices_by_id() -> Mapping[str, Mapping[str, str]]:
+    return MappingProxyType({v["id"]: v for v in get_available_voices()})
+
+
+def get_voice(voice_id: str) -> Mapping[str, str] | None:
+    return _voices_by_id().get(voice_id)
 
 
 _onnx_session_timestamped = None
-_voice_data = None
+_voice_lock = threading.Lock()
+_durations_executor = ThreadPoolExecutor(
+    max_workers=_TTS_WORKERS, thread_name_prefix="tts-durations"
+)
+
+
+@functools.cache
+def _shrink_run_options() -> ort.RunOptions:
+    """Return run options that hand unused arena memory back after a run."""
+    options = ort.RunOptions()
+    options.add_run_config_entry("memory.enable_memory_arena_shrinkage", "cpu:0")
+    return options
 
 
 def _get_onnx_session_timestamped():
     global _onnx_session_timestamped
-    if _onnx_session_timestamped is None:
-        if TIMESTAMPED_MODEL_PATH is None:
-            raise RuntimeError("Timestamped model not available")
-        _onnx_session_timestamped = ort.InferenceSession(
-            str(TIMESTAMPED_MODEL_PATH), providers=["CPUExecutionProvider"]
-        )
+    with _session_lock:
+        if _onnx_session_timestamped is None:
+            if TIMESTAMPED_MODEL_PATH is None:
+                raise RuntimeError("Timestamped model not available")
+            _onnx_session_timestamped = _create_session(TIMESTAMPED_MODEL_PATH)
     return _onnx_session_timestamped
 
 
-def _get_voice_data():
-    global _voice_data
-    if _voice_data is None:
-        _voice_data = _load_voice_data(VOICES_PATH)
-    return _voice_data
+@functools.cache
+def _get_voice_data() -> Mapping[str, np.ndarray]:
+    return _load_voice_data(VOICES_PATH)
+
+
+@functools.cache
+def _get_voice_styles(voice: str) -> np.ndarray | None:
+    """Read a single voice's style table from the archive on first use."""
+    with _voice_lock:
+        voice_data = _get_voice_data()
+        if voice not in voice_data:
+            return None
+        return voice_data[voice].astype(np.float32)
 
 
 MAX_PHONEME_LENGTH = 500
 
 
 def _get_durations_from_timestamped_model(
-    chunk: str, voice: str, speed: float
-) -> tuple[list, np.ndarray | None]:
+    phonemes: str, voice: str, speed: float, shrink_arena: bool = False
+) -> np.ndarray | None:
     """Get duration predictions from timestamped model (for timestamp calculation only)."""
-    g2p = _get_g2p()
     sess = _get_onnx_session_timestamped()
-    voice_data = _get_voice_data()
-
-    if voice not in voice_data:
-        return [], None
+    voice_styles = _get_voice_styles(voice)
 
-    voice_styles = voice_data[voice]
+    if voice_styles is None:
+        return None
 
-    phonemes, tokens = g2p(chunk)
     input_ids = _tokenize_phonemes(phonemes)
 
     if not input_ids or len(input_ids) > MAX_PHONEME_LENGTH:
-        return tokens, None
+        return None
 
     input_ids_padded = np.array([[0] + input_ids + [0]], dtype=np.int64)
     style_idx = min(len(input_ids), len(voice_styles) - 1)
-    style = voice_styles[style_idx].astype(np.float32)
+    style = voice_styles[style_idx]
     speed_arr = np.array([speed], dtype=np.float32)
 
     inputs = {
@@ -441,24 +677,33 @@ def _get_durations_from_timestamped_model(
         "speed": speed_arr,
     }
 
-    outputs = sess.run(None, inputs)
-    pred_dur = outputs[1].squeeze() if len(outputs) > 1 else None
-
-    return tokens, pred_dur
+    run_options = _shrink_run_options() if shrink_arena else None
+    outputs = sess.run(None, inputs, run_options=run_options)
+    return outputs[1].squeeze() if len(outputs) > 1 else None
 
 
 def _generate_chunk_with_timestamps(
-    chunk: str, voice: str, speed: float
+    chunk: str, voice: str, speed: float, shrink_arena: bool = False
 ) -> tuple[np.ndarray, list[dict]]:
-    """Generate audio with kokoro-onnx (quality) and get timestamps from timestamped model."""
+    """Generate audio and timestamps from the same misaki phonemes."""
     kokoro = get_kokoro()
-    audio, _ = _generate_chunk_audio(kokoro, chunk, voice, speed)
+    try:
+        with _espeak_lock:
+            phonemes, tokens = _get_g2p()(chunk)
+    except Exception:
+        audio, _ = _generate_chunk_audio(kokoro, chunk, voice, speed)
+        return audio, []
+
+    durations = _durations_executor.submit(
+        _get_durations_from_timestamped_model, phonemes, voice, speed, shrink_arena
+    )
+    audio, _ = _generate_chunk_audio(kokoro, chunk, voice, speed, phonemes=phonemes)
 
     if len(audio) == 0:
         return audio, []
 
     try:
-        tokens, pred_dur = _get_durations_from_timestamped_model(chunk, voice, speed)
+        pred_dur = durations.result()
         if pred_dur is not None:
             raw_timestamps = _calculate_word_timestamps(tokens, pred_dur, speed)
             if raw_timestamps:
@@ -477,10 +722,7 @@ def _generate_chunk_with_timestamps(
 
 
 def _split_into_sentences(text: str) -> list[str]:
-    abbreviations = r"(?<!\bMr)(?<!\bMrs)(?<!\bDr)(?<!\bMs)(?<!\bProf)(?<!\bSr)(?<!\bJr)(?<!\bvs)(?<!\betc)(?<!\be\.g)(?<!\bi\.e)(?<!\bNo)(?<!\bSt)"
-    pattern = abbreviations + r'(?<=[.!?])\s+(?=[A-Z"\']|$)'
-    sentences = [s.strip() for s in re.split(pattern, text) if s.strip()]
-    return sentences
+    return [s.strip() for s in _SENTENCE_SPLIT_RE.split(text) if s.strip()]
 
 
 def _organize_timestamps_into_sentences(
@@ -528,45 +770,41 @@ def generate_audio_with_timestamps(
 
     chunks = split_into_chunks(text)
     total_chunks = len(chunks)
-    all_samples = []
     all_timestamps = []
     cumulative_time = 0.0
 
-    for i, chunk in enumerate(chunks):
-        if progress_callback:
-            progress_callback(
-                i + 1, total_chunks, f"Processing chunk {i + 1}/{total_chunks}"
-            )
-
-        audio, chunk_timestamps = _generate_chunk_with_timestamps(chunk, voice, speed)
+    with _chunk_executor() as executor, _mp3_encoder(output_path) as write_pcm:
+        last_chunk = total_chunks - 1
 
-        if len(audio) == 0:
-            continue
+        def synthesize(item: tuple[int, str]) -> tuple[np.ndarray, list[dict]]:
+            i, chunk = item
+            return _generate_chunk_with_timestamps(
+                chunk, voice, speed, shrink_arena=i == last_chunk
+            )
 
-        for ts in chunk_timestamps:
-            ts["start"] += cumulative_time
-            ts["end"] += cumulative_time
+        results = _synthesize_in_order(executor, synthesize, enumerate(chunks))
+        for i, (audio, chunk_timestamps) in enumerate(results):
+            if progress_callback:
+                progress_callback(
+                    i + 1, total_chunks, f"Processing chunk {i + 1}/{total_chunks}"
+                )
 
-        all_timestamps.extend(chunk_timestamps)
-        all_samples.append(audio)
-        cumulative_time += len(audio) / SAMPLE_RATE
+            if len(audio) == 0:
+                continue
 
-    if not all_samples:
-        raise ValueError("No audio generated")
+            for ts in chunk_timestamps:
+                ts["start"] += cumulative_time
+                ts["end"] += cumulative_time
 
-    if progress_callback:
-        progress_callback(total_chunks, total_chunks, "Combining audio...")
+            all_timestamps.extend(chunk_timestamps)
+            write_pcm(audio)
+            cumulative_time += len(audio) / SAMPLE_RATE
 
-    combined = np.concatenate(all_samples)
-    wav_path = output_path.with_suffix(".wav")
-    sf.write(str(wav_path), combined, SAMPLE_RATE)
+        if not cumulative_time:
+            raise ValueError("No audio generated")
 
-    if progress_callback:
-        progress_callback(total_chunks, total_chunks, "Converting to MP3...")
-
-    audio_segment = AudioSegment.from_wav(str(wav_path))
-    audio_segment.export(str(output_path), format="mp3", bitrate=_BITRATE)
-    wav_path.unlink()
+        if progress_callback:
+            progress_callback(total_chunks, total_chunks, "Converting to MP3...")
 
     sentences = _organize_timestamps_into_sentences(text, all_timestamps)
 
@@ -1,35 +1,43 @@
 """Background worker for processing articles."""
 
-import hashlib
 import json
 import os
+import secrets
 import shutil
 import subprocess
 import threading
 import time
-import uuid
 
-import requests
+from blake3 import blake3
 
 from outloud import db, extractor, cleaner, tts
-from outloud.config import TEXTS_DIR, AUDIO_DIR, UPLOAD_DIR, TIMESTAMPS_DIR, get_logger
+from outloud.config import (
+    get_audio_dir,
+    get_logger,
+    get_texts_dir,
+    get_timestamps_dir,
+    get_upload_dir,
+)
 
 logger = get_logger("worker")
 
-_worker_thread: threading.Thread | None = None
-_wake_event = threading.Event()
+_PREPARE_STAGES = ("queued", "extracting", "extracted", "cleaning")
+_AUDIO_STAGES = ("cleaned", "generating")
 
+_worker_threads: list[threading.Thread] = []
+_prepare_wake = threading.Event()
+_audio_wake = threading.Event()
+_ollama_launch_attempted = False
 
-def _ensure_ollama_running():
-    def is_ollama_ready():
-        try:
-            requests.get("http://localhost:11434/api/tags", timeout=1)
-            return True
-        except Exception:
-            return False
 
-    if is_ollama_ready():
-        return
+def _ensure_ollama_running() -> bool:
+    """Start Ollama the first time cleanup needs it and report whether it is up."""
+    global _ollama_launch_attempted
+    if cleaner.is_ollama_running():
+        return True
+    if _ollama_launch_attempted:
+        return False
+    _ollama_launch_attempted = True
 
     ollama_paths = [
         shutil.which("ollama"),
@@ -42,7 +50,7 @@ def _ensure_ollama_running():
 
     if not ollama_bin:
         logger.warning("Ollama not found - text cleanup will be skipped")
-        return
+        return False
 
     try:
         subprocess.Popen(
@@ -53,17 +61,21 @@ def _ensure_ollama_running():
         )
     except Exception as e:
         logger.warning(f"Could not start Ollama: {e} - text cleanup will be skipped")
-        return
+        return False
 
-    for _ in range(30):
-        time.sleep(0.5)
-        if is_ollama_ready():
+    deadline = time.monotonic() + 15
+    delay = 0.025
+    while time.monotonic() < deadline:
+        time.sleep(delay)
+        if cleaner.is_ollama_running():
             logger.info("Ollama started successfully")
-            return
+            return True
+        delay = min(delay * 2, 0.5)
 
     logger.warning(
         "Ollama failed to start within 15 seconds - text cleanup will be skipped"
     )
+    return False
 
 
 def _reset_in_progress_articles():
@@ -75,50 +87,59 @@ def _reset_in_progress_articles():
         return
 
     in_progress_stages = {"extracting", "cleaning", "generating"}
+    article_ids = []
     for article in articles:
         stage = article.get("processing_stage")
-        if stage in in_progress_stages:
-            article_id = article.get("id")
-            if article_id is None:
-                continue
-            try:
-                logger.info(
-                    f"Resetting article {article_id} from '{stage}' to 'queued' after restart"
-                )
-                db.update_article_stage(article_id, "queued")
-            except Exception as e:
-                logger.exception(f"Failed to reset article {article_id}: {e}")
+        article_id = article.get("id")
+        if stage in in_progress_stages and article_id is not None:
+            logger.info(
+                f"Resetting article {article_id} from '{stage}' to 'queued' after restart"
+            )
+            article_ids.append(article_id)
+
+    try:
+        db.update_articles_stage(article_ids, "queued")
+    except Exception as e:
+        logger.exception(f"Failed to reset articles {article_ids}: {e}")
 
 
 def start_worker():
-    global _worker_thread
-    if _worker_thread is not None and _worker_thread.is_alive():
+    """Start one thread for extraction and cleanup and one for audio generation."""
+    if any(thread.is_alive() for thread in _worker_threads):
         return
 
-    _ensure_ollama_running()
     _reset_in_progress_articles()
     _scan_uploads_directory()
 
-    _worker_thread = threading.Thread(target=_worker_loop, daemon=True)
-    _worker_thread.start()
+    _worker_threads[:] = [
+        threading.Thread(
+            target=_worker_loop,
+            args=(_PREPARE_STAGES, _prepare_wake, _prepare_article),
+            name="worker-prepare",
+            daemon=True,
+        ),
+        threading.Thread(
+            target=_worker_loop,
+            args=(_AUDIO_STAGES, _audio_wake, _generate_article_audio),
+            name="worker-audio",
+            daemon=True,
+        ),
+    ]
+    for thread in _worker_threads:
+        thread.start()
     logger.info("Background worker started")
 
 
 def _scan_uploads_directory():
-    if not UPLOAD_DIR.exists():
-        return
-
     tracked = {a["source_path"] for a in db.get_all_articles() if a.get("source_path")}
 
-    for pdf_file in UPLOAD_DIR.glob("*.pdf"):
+    for pdf_file in get_upload_dir().glob("*.pdf"):
         if pdf_file.name in tracked:
             continue
 
-        sha256 = hashlib.sha256()
-        with open(pdf_file, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        content_hash = sha256.hexdigest()[:16]
+        digest = blake3(max_threads=blake3.AUTO)
+        digest.update_mmap(pdf_file)
+        content_hash = digest.hexdigest()[:16]
 
         existing = db.get_article_by_hash(content_hash)
         if existing:
@@ -142,67 +163,73 @@ def _scan_uploads_directory():
 
 
 def notify_new_article():
-    _wake_event.set()
+    _prepare_wake.set()
+    _audio_wake.set()
 
 
-def _worker_loop():
+def _worker_loop(stages, wake_event, handle_article):
     while True:
         try:
-            articles = db.get_articles_to_process()
-            if not articles:
-                _wake_event.clear()
-                _wake_event.wait(timeout=30)
+            article_ids = db.get_article_ids_to_process(stages)
+            if not article_ids:
+                wake_event.clear()
+                wake_event.wait(timeout=30)
                 continue
 
-            for article in articles:
-                _process_article(article)
+            articles = db.get_articles_by_ids(article_ids)
+            for article_id in article_ids:
+                article = articles.get(article_id)
+                if article and article["processing_stage"] in stages:
+                    handle_article(article)
 
         except (ConnectionError, TimeoutError, OSError) as e:
             logger.exception(f"Recoverable worker loop error: {e}")
-            _wake_event.wait(timeout=5)
+            wake_event.wait(timeout=5)
         except Exception as e:
             logger.exception(f"Unrecoverable worker loop error: {e}")
             raise
 
 
-def _process_article(article: dict):
+def _prepare_article(article: dict):
     article_id = article["id"]
-    stage = article["processing_stage"]
 
     try:
-        if stage in ("queued", "extracting"):
+        if article["processing_stage"] in ("queued", "extracting"):
             _do_extraction(article)
 
-        article = db.get_article(article_id)
-        if not article:
-            return
-        stage = article["processing_stage"]
+            article = db.get_article(article_id)
+            if not article:
+                return
 
-        if stage in ("extracted", "cleaning"):
+        if article["processing_stage"] in ("extracted", "cleaning"):
             _do_cleaning(article)
+            _audio_wake.set()
 
-        article = db.get_article(article_id)
-        if not article:
-            return
-        stage = article["processing_stage"]
+    except Exception as e:
+        _fail_article(article_id, e)
 
-        if stage in ("cleaned", "generating"):
-            _do_audio_generation(article)
 
+def _generate_article_audio(article: dict):
+    try:
+        _do_audio_generation(article)
     except Exception as e:
-        logger.exception(f"Error processing article {article_id}: {e}")
-        if db.get_article(article_id):
-            db.set_article_error(article_id, str(e))
+        _fail_article(article["id"], e)
+
+
+def _fail_article(article_id: int, error: Exception):
+    logger.exception(f"Error processing article {article_id}: {error}")
+    if db.get_article(article_id):
+        db.set_article_error(article_id, str(error))
 
 
 def _do_extraction(article: dict):
     article_id = article["id"]
     source_type = article["source_type"]
     source_path = article["source_path"]
-    content_hash = article.get("content_hash") or str(uuid.uuid4())[:16]
+    content_hash = article.get("content_hash") or secrets.token_hex(8)
 
     existing_raw = article.get("raw_txt_path")
-    if existing_raw and (TEXTS_DIR / existing_raw).exists():
+    if existing_raw and (get_texts_dir() / existing_raw).exists():
         logger.info(f"Article {article_id} already has raw text, skipping extraction")
         db.update_article_stage(article_id, "extracted")
         return
@@ -210,8 +237,12 @@ def _do_extraction(article: dict):
     db.update_article_stage(article_id, "extracting")
     logger.info(f"Extracting article {article_id} from {source_type}")
 
-    if source_type == "pdf":
-        pdf_path = UPLOAD_DIR / source_path
+    if source_type == "text":
+        title, text = article["title"], article.get("source_text")
+        if not text:
+            raise ValueError(f"Article {article_id} has no pasted text")
+    elif source_type == "pdf":
+        pdf_path = get_upload_dir() / source_path
         title, text = extractor.extract_from_pdf(str(pdf_path))
     elif source_type == "url":
         title, text = extractor.extract_from_url(source_path)
@@ -219,7 +250,7 @@ def _do_extraction(article: dict):
         raise ValueError(f"Unknown source type: {source_type}")
 
     txt_filename = f"{content_hash}_raw.txt"
-    txt_path = TEXTS_DIR / txt_filename
+    txt_path = get_texts_dir() / txt_filename
     extractor.save_text(text, str(txt_path))
 
     db.update_article_stage(
@@ -228,6 +259,7 @@ def _do_extraction(article: dict):
         title=title,
         txt_path=txt_filename,
         raw_txt_path=txt_filename,
+        source_text=None,
     )
     logger.info(f"Article {article_id} extracted: {title}")
 
@@ -235,13 +267,13 @@ def _do_extraction(article: dict):
 def _do_cleaning(article: dict):
     article_id = article["id"]
     raw_txt_path = article["raw_txt_path"]
-    content_hash = article.get("content_hash") or str(uuid.uuid4())[:16]
+    content_hash = article.get("content_hash") or secrets.token_hex(8)
 
     if not raw_txt_path:
         raise ValueError(f"Article {article_id} has no raw text to clean")
 
     cleaned_filename = f"{content_hash}_cleaned.txt"
-    cleaned_path = TEXTS_DIR / cleaned_filename
+    cleaned_path = get_texts_dir() / cleaned_filename
     if cleaned_path.exists():
         logger.info(f"Article {article_id} already has cleaned text, skipping cleanup")
         db.update_article_stage(
@@ -249,10 +281,10 @@ def _do_cleaning(article: dict):
         )
         return
 
-    txt_path = TEXTS_DIR / raw_txt_path
+    txt_path = get_texts_dir() / raw_txt_path
     text = txt_path.read_text(encoding="utf-8")
 
-    if not cleaner.is_ollama_running():
+    if not _ensure_ollama_running():
         logger.info(f"Ollama not running, skipping cleanup for article {article_id}")
         db.update_article_stage(article_id, "cleaned")
         return
@@ -278,29 +310,37 @@ def _do_audio_generation(article: dict):
     article_id = article["id"]
     source_txt = article["cleaned_txt_path"] or article["raw_txt_path"]
     voice = article["voice"] or "af_heart"
-    content_hash = article.get("content_hash") or str(uuid.uuid4())[:16]
+    content_hash = article.get("content_hash") or secrets.token_hex(8)
 
     if not source_txt:
         raise ValueError("No text available for audio generation")
 
     mp3_filename = f"{content_hash}_{voice}.mp3"
-    mp3_path = AUDIO_DIR / mp3_filename
+    mp3_path = get_audio_dir() / mp3_filename
     timestamps_filename = f"{content_hash}_{voice}_timestamps.json"
-    timestamps_path = TIMESTAMPS_DIR / timestamps_filename
+    timestamps_path = get_timestamps_dir() / timestamps_filename
 
     if mp3_path.exists() and timestamps_path.exists():
         logger.info(f"Article {article_id} already has audio, skipping generation")
         db.update_article_mp3(article_id, mp3_filename, timestamps_filename)
         return
 
-    txt_path = TEXTS_DIR / source_txt
+    txt_path = get_texts_dir() / source_txt
     text = txt_path.read_text(encoding="utf-8")
 
     db.update_article_stage(article_id, "generating")
     logger.info(f"Generating audio for article {article_id}")
 
+    last_progress = ("", 0.0)
+
     def progress_callback(current, total, status):
+        nonlocal last_progress
         progress_text = f"{current}/{total} chunks"
+        now = time.monotonic()
+        last_text, last_time = last_progress
+        if progress_text == last_text or (current < total and now - last_time < 1):
+            return
+        last_progress = (progress_text, now)
         db.update_article_progress(article_id, progress_text)
 
     _, sentences = tts.generate_audio_with_timestamps(
@@ -0,0 +1,133 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+os.environ["OUTLOUD_DATA_DIR"] = tempfile.mkdtemp(prefix="outloud_worker_test_")
+
+from outloud import db  # noqa: E402
+from outloud.config import get_texts_dir  # noqa: E402
+from outloud.worker import worker  # noqa: E402
+
+
+def test_text_article_extracts_source_text():
+    article_id = db.create_article(
+        title="Pasted Text",
+        source_type="text",
+        source_path="",
+        content_hash="pastedtext000001",
+        source_text="Some pasted text to read aloud.",
+    )
+
+    worker._do_extraction(db.get_article(article_id))
+
+    article = db.get_article(article_id)
+    assert article["processing_stage"] == "extracted"
+    assert article["raw_txt_path"] == "pastedtext000001_raw.txt"
+    raw_text = (get_texts_dir() / article["raw_txt_path"]).read_text(encoding="utf-8")
+    assert raw_text == "Some pasted text to read aloud."
+    assert article["source_text"] is None
+
+
+def test_prepare_and_audio_threads_own_disjoint_stages():
+    stages = [
+        "queued",
+        "extracting",
+        "extracted",
+        "cleaning",
+        "cleaned",
+        "generating",
+        "ready",
+        "error",
+    ]
+    ids_by_stage = {}
+    for stage in stages:
+        article_id = db.create_article(
+            title=stage, source_type="url", source_path="https://example.com"
+        )
+        db.update_article_stage(article_id, stage)
+        ids_by_stage[stage] = article_id
+
+    prepare_ids = set(db.get_article_ids_to_process(worker._PREPARE_STAGES))
+    audio_ids = set(db.get_article_ids_to_process(worker._AUDIO_STAGES))
+
+    assert {ids_by_stage[s] for s in stages} & prepare_ids == {
+        ids_by_stage[s] for s in ("queued", "extracting", "extracted", "cleaning")
+    }
+    assert {ids_by_stage[s] for s in stages} & audio_ids == {
+        ids_by_stage[s] for s in ("cleaned", "generating")
+    }
+
+
+def test_audio_progress_writes_are_throttled():
+    article_id = db.create_article(
+        title="Throttle",
+        source_type="text",
+        source_path="",
+        voice="af_heart",
+        content_hash="throttle00000001",
+    )
+    (get_texts_dir() / "throttle00000001_raw.txt").write_text("Hello.", "utf-8")
+    db.update_article_stage(
+        article_id, "cleaned", raw_txt_path="throttle00000001_raw.txt"
+    )
+
+    def fake_generate(text, output_path, voice, progress_callback):
+        for i in range(1, 6):
+            progress_callback(i, 5, f"Processing chunk {i}/5")
+        progress_callback(5, 5, "Complete!")
+        return output_path, []
+
+    clock = [100.0, 100.2, 100.4, 101.5, 101.6, 101.7]
+    with (
+        patch.object(worker.tts, "generate_audio_with_timestamps", fake_generate),
+        patch.object(worker.time, "monotonic", side_effect=clock),
+        patch.object(worker.db, "update_article_progress") as update_progress,
+    ):
+        worker._do_audio_generation(db.get_article(article_id))
+
+    written = [call.args[1] for call in update_progress.call_args_list]
+    assert written == ["1/5 chunks", "4/5 chunks", "5/5 chunks"]
+
+
+def test_ollama_started_only_on_first_cleanup(monkeypatch):
+    monkeypatch.setattr(worker, "_ollama_launch_attempted", False)
+    with (
+        patch.object(
+            worker.cleaner, "is_ollama_running", side_effect=[False, False, True, True]
+        ),
+        patch.object(worker.shutil, "which", return_value="/usr/bin/ollama"),
+        patch.object(worker.os.path, "isfile", return_value=True),
+        patch.object(worker.subprocess, "Popen") as popen,
+        patch.object(worker.time, "sleep"),
+    ):
+        assert worker._ensure_ollama_running() is True
+        assert worker._ensure_ollama_running() is True
+
+    popen.assert_called_once()
+    assert popen.call_args.args[0] == ["/usr/bin/ollama", "serve"]
+
+
+def test_ollama_start_gives_up_after_backoff(monkeypatch, caplog):
+    monkeypatch.setattr(worker, "_ollama_launch_attempted", False)
+    now = [0.0]
+
+    def fake_sleep(delay):
+        now[0] += delay
+
+    with (
+        patch.object(worker.cleaner, "is_ollama_running", return_value=False),
+        patch.object(worker.shutil, "which", return_value="/usr/bin/ollama"),
+        patch.object(worker.os.path, "isfile", return_value=True),
+        patch.object(worker.subprocess, "Popen") as popen,
+        patch.object(worker.time, "sleep", side_effect=fake_sleep) as sleep,
+        patch.object(worker.time, "monotonic", side_effect=lambda: now[0]),
+    ):
+        assert worker._ensure_ollama_running() is False
+        assert worker._ensure_ollama_running() is False
+
+    popen.assert_called_once()
+    delays = [call.args[0] for call in sleep.call_args_list]
+    assert delays[:4] == [0.025, 0.05, 0.1, 0.2]
+    assert max(delays) == 0.5
+    assert 15 <= now[0] < 16
+    assert "failed to start within 15 seconds" in caplog.text